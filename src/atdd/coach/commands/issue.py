@@ -585,6 +585,13 @@ class IssueManager:
             print("Create one with: atdd new my-feature")
             return 0
 
+        # One batched GraphQL query covers every open issue's sub-issues;
+        # per-issue REST calls remain the fallback (see below)
+        try:
+            subs_by_issue = client.get_all_sub_issues("atdd-issue", "OPEN")
+        except Exception:
+            subs_by_issue = {}
+
         print("\n" + "=" * 80)
         print("ATDD Issues")
         print("=" * 80)
@@ -605,7 +612,10 @@ class IssueManager:
 
             # Get sub-issue progress
             try:
-                subs = client.get_sub_issues(num)
+                subs = subs_by_issue.get(num)
+                # The batch query returns at most 50 sub-issues per parent
+                if subs is None or len(subs) >= 50:
+                    subs = client.get_sub_issues(num)
                 total = len(subs)
                 closed = sum(1 for s in subs if s.get("state") == "closed")
                 progress = f"{closed}/{total}" if total > 0 else "-"
@@ -6,10 +6,10 @@ Manages the phased rollout of coverage validation rules:
 - Phase 2 (PLANNER_TESTER_ENFORCEMENT): Sections 2 + 3 validators strict
 - Phase 3 (FULL_ENFORCEMENT): All validators (including Section 4) strict
 
-Usage in validators:
-    from atdd.coach.utils.coverage_phase import CoveragePhase, should_enforce
+Usage in validators (should_enforce() remains for phases chosen at runtime):
+    from atdd.coach.utils.coverage_phase import CoveragePhase, ENFORCE_PLANNER_TESTER
 
-    if should_enforce(CoveragePhase.PLANNER_TESTER_ENFORCEMENT):
+    if ENFORCE_PLANNER_TESTER:
         assert condition, "Error message"
     else:
         if not condition:
@@ -20,6 +20,8 @@ from enum import IntEnum
 from typing import Optional
 import warnings
 
+from atdd.coach.utils.warning_filters import user_warnings_ignored
+
 
 class CoveragePhase(IntEnum):
     """
@@ -38,6 +40,10 @@ class CoveragePhase(IntEnum):
 # Current rollout phase - update this to advance through phases
 CURRENT_PHASE = CoveragePhase.WARNINGS_ONLY
 
+# Precomputed for hot validator loops; the phase is fixed at import time
+ENFORCE_PLANNER_TESTER = CURRENT_PHASE >= CoveragePhase.PLANNER_TESTER_ENFORCEMENT
+ENFORCE_FULL = CURRENT_PHASE >= CoveragePhase.FULL_ENFORCEMENT
+
 
 def should_enforce(validator_phase: CoveragePhase) -> bool:
     """
@@ -66,14 +72,17 @@ def get_current_phase() -> CoveragePhase:
     return CURRENT_PHASE
 
 
+_PHASE_NAMES = {
+    CoveragePhase.WARNINGS_ONLY: "Phase 1: Warnings Only",
+    CoveragePhase.PLANNER_TESTER_ENFORCEMENT: "Phase 2: Planner+Tester Enforcement",
+    CoveragePhase.FULL_ENFORCEMENT: "Phase 3: Full Enforcement",
+}
+
+
 def get_phase_name(phase: Optional[CoveragePhase] = None) -> str:
     """Get human-readable name for a phase."""
     phase = phase or CURRENT_PHASE
-    return {
-        CoveragePhase.WARNINGS_ONLY: "Phase 1: Warnings Only",
-        CoveragePhase.PLANNER_TESTER_ENFORCEMENT: "Phase 2: Planner+Tester Enforcement",
-        CoveragePhase.FULL_ENFORCEMENT: "Phase 3: Full Enforcement",
-    }.get(phase, "Unknown Phase")
+    return _PHASE_NAMES.get(phase, "Unknown Phase")
 
 
 def emit_coverage_warning(
@@ -89,6 +98,9 @@ def emit_coverage_warning(
         message: The warning message
         validator_phase: Phase when this becomes an error
     """
+    # Skip formatting when the message would be discarded (e.g. -W ignore)
+    if user_warnings_ignored():
+        return
     phase_name = get_phase_name(validator_phase)
     warnings.warn(
         f"[{spec_id}] {message} (will become error in {phase_name})",
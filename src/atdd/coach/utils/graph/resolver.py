@@ -16,16 +16,331 @@ Architecture:
 """
 from __future__ import annotations
 
+import atexit
+import functools
+import inspect
+import json
+import mmap
 import os
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Protocol, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Protocol, Tuple
 from abc import ABC, abstractmethod
 
-from atdd.coach.utils.repo import find_repo_root
+import yaml
+from yaml.constructor import SafeConstructor
+from yaml.resolver import Resolver as YAMLResolver
+
+from atdd.coach.utils.repo import atdd_cache_dir, find_repo_root
 from atdd.coach.utils.graph.urn import URNBuilder
 
+# Edge lists resolve the same URN many times; cache the parsed components.
+# The returned dicts are shared between callers and must be treated as read-only.
+_parse_urn = functools.lru_cache(maxsize=8192)(URNBuilder.parse_urn)
+
+# libyaml-backed parser when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+# Stateless for scalars; shared by _construct_yaml_scalar()
+_YAML_RESOLVER = YAMLResolver()
+_YAML_CONSTRUCTOR = SafeConstructor()
+
+
+def _construct_yaml_scalar(event) -> object:
+    """Build a Python value from a scalar event exactly as yaml.safe_load would."""
+    tag = event.tag
+    if tag is None or tag == "!":
+        tag = _YAML_RESOLVER.resolve(yaml.ScalarNode, event.value, event.implicit)
+    node = yaml.ScalarNode(tag, event.value, style=event.style)
+    construct = SafeConstructor.yaml_constructors.get(
+        tag, SafeConstructor.construct_undefined
+    )
+    return construct(_YAML_CONSTRUCTOR, node)
+
+
+def _extract_yaml_fields(
+    path: Path, wanted: frozenset
+) -> Optional[Dict[Tuple[str, ...], list]]:
+    """
+    Pluck scalar values at selected key paths from a YAML file.
+
+    Walks PyYAML's event stream (libyaml-backed when available) instead of
+    materializing the whole document, which is all find_declarations needs.
+    ``wanted`` holds key paths such as ``("urn",)`` or
+    ``("acceptances", "*", "identity", "urn")`` where ``"*"`` matches any
+    sequence item.
+
+    Returns a dict mapping each matched path to its values in document order,
+    or None when the document is not a non-empty mapping (mirroring the
+    ``data and isinstance(data, dict)`` guard). Falls back to yaml.safe_load
+    for documents using aliases. Raises on malformed YAML, like safe_load.
+    """
+    with open(path, "rb") as f:
+        events = list(yaml.parse(f, Loader=_YAML_LOADER))
+
+    if any(isinstance(e, yaml.AliasEvent) for e in events):
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f)
+        return _pluck_yaml_fields(data, wanted) if data and isinstance(data, dict) else None
+
+    if sum(isinstance(e, yaml.DocumentStartEvent) for e in events) > 1:
+        raise yaml.YAMLError(f"expected a single document in {path}")
+
+    found: Dict[Tuple[str, ...], list] = {}
+    root_keys = 0
+    # Each frame: [key_path, is_mapping, pending_key]; pending_key is None
+    # while a mapping expects its next key.
+    stack: List[list] = []
+    for event in events:
+        if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+            if not stack and not isinstance(event, yaml.MappingStartEvent):
+                return None
+            if stack:
+                parent = stack[-1]
+                key = parent[2] if parent[1] else "*"
+                child_path = parent[0] + (key,)
+            else:
+                child_path = ()
+            stack.append([child_path, isinstance(event, yaml.MappingStartEvent), None])
+        elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+            stack.pop()
+            if stack and stack[-1][1]:
+                stack[-1][2] = None
+        elif isinstance(event, yaml.ScalarEvent):
+            if not stack:
+                return None
+            frame = stack[-1]
+            if frame[1] and frame[2] is None:
+                frame[2] = event.value
+                if len(stack) == 1:
+                    root_keys += 1
+                continue
+            key_path = frame[0] + ((frame[2],) if frame[1] else ("*",))
+            if key_path in wanted:
+                found.setdefault(key_path, []).append(_construct_yaml_scalar(event))
+            if frame[1]:
+                frame[2] = None
+
+    return found if root_keys else None
+
+
+def _pluck_yaml_fields(data: dict, wanted: frozenset) -> Dict[Tuple[str, ...], list]:
+    """Collect values at ``wanted`` key paths from an already-loaded document."""
+    found: Dict[Tuple[str, ...], list] = {}
+
+    def visit(node, key_path):
+        if isinstance(node, dict):
+            for key, value in node.items():
+                visit(value, key_path + (key,))
+        elif isinstance(node, list):
+            for item in node:
+                visit(item, key_path + ("*",))
+        elif key_path in wanted:
+            found.setdefault(key_path, []).append(node)
+
+    visit(data, ())
+    return found
+
+
+def _safe_read(path: Path) -> Optional[str]:
+    """Read a UTF-8 text file, returning None if it cannot be read."""
+    try:
+        return path.read_text(encoding="utf-8")
+    except Exception:
+        return None
+
+
+def _read_files_parallel(
+    paths: List[Path],
+    max_workers: int = 16,
+    reader: Callable[[Path], Any] = _safe_read,
+) -> Iterator[Tuple[Path, Any]]:
+    """
+    Read many small files concurrently, yielding (path, reader(path)) in order.
+
+    Blocking reads release the GIL, so threads overlap the syscalls on a
+    cold cache. Small batches are read inline to skip pool start-up.
+    """
+    if len(paths) < 2:
+        for path in paths:
+            yield path, reader(path)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+        yield from zip(paths, executor.map(reader, paths))
+
+
+# WMBT file names: {STEP_CODE}{NNN}.yaml
+_WMBT_FILENAME_RE = re.compile(r"^[DLPCEMYRK]\d{3}\.yaml$")
+
+# SQL artifacts: CREATE TABLE statements and {timestamp}_{name}.sql migrations
+_TABLE_CREATE_RE = re.compile(
+    rb'create\s+table\s+(?:if\s+not\s+exists\s+)?(?:"?\w+"?\.)?"?(\w+)',
+    re.IGNORECASE,
+)
+_MIGRATION_FILENAME_RE = re.compile(r"^(\d{14}_[a-z][a-z0-9_]*)\.sql$")
+
+# SQL files at least this large are scanned through mmap instead of read()
+_MMAP_MIN_SIZE = 4096
+# Files shorter than the shortest possible statement cannot declare a table
+_MIN_CREATE_TABLE_SIZE = len("create table x")
+
+
+def _scan_table_names(path: Path) -> List[str]:
+    """
+    Table names from the CREATE TABLE statements in a SQL file.
+
+    Scans the raw bytes, memory-mapping large files so the contents are
+    never copied into a Python object; only the captured names are decoded.
+    Unreadable files yield no names.
+    """
+    try:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _MIN_CREATE_TABLE_SIZE:
+                return []
+            if size < _MMAP_MIN_SIZE:
+                return [m.group(1).decode("utf-8", "replace")
+                        for m in _TABLE_CREATE_RE.finditer(f.read())]
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return [m.group(1).decode("utf-8", "replace")
+                        for m in _TABLE_CREATE_RE.finditer(mm)]
+    except (OSError, ValueError):
+        return []
+
+
+# Fields read from WMBT files. WMBTResolver and AcceptanceResolver request
+# the same selection so each file is parsed once and the second resolver is
+# served from the shared _FieldCache.
+_ACC_URN_PATH = ("acceptances", "*", "identity", "urn")
+_WMBT_FIELDS = frozenset({("urn",), _ACC_URN_PATH})
+
+# Opt-in on-disk copy of the _extract_yaml_fields() cache (see _FieldCache),
+# stored as .atdd/cache/FIELD_CACHE_FILE in the repository
+FIELD_CACHE_FILE = "resolver-fields.json"
+_FIELD_CACHE_VERSION = 1
+_field_caches: Dict[Tuple[Path, bool], "_FieldCache"] = {}
+_field_caches_lock = threading.Lock()
+
+# Recursive listings shared by all resolvers (see BaseResolver._cached_rglob).
+# Each entry keeps the mtime_ns of every directory walked; a listing is
+# reused while none of those directories has gained or lost an entry.
+_listing_cache: Dict[Tuple[Path, str], Tuple[List[Tuple[str, int]], List[Path]]] = {}
+
+
+def _scan_tree(root: Path, suffix: str) -> Tuple[List[Tuple[str, int]], List[Path]]:
+    """
+    Walk ``root`` with an explicit os.scandir stack.
+
+    Returns the (dirpath, mtime_ns) of each directory visited and the files
+    whose name ends with ``suffix``. Entry types come from the DirEntry, so
+    non-matching entries cost no stat and no Path object. Symlinked
+    directories are not followed.
+    """
+    stamps: List[Tuple[str, int]] = []
+    paths: List[Path] = []
+    stack = [str(root)]
+    while stack:
+        dirpath = stack.pop()
+        try:
+            mtime = os.stat(dirpath).st_mtime_ns
+            with os.scandir(dirpath) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(suffix) and entry.is_file():
+                        paths.append(Path(entry.path))
+        except OSError:
+            continue
+        stamps.append((dirpath, mtime))
+    return stamps, paths
+
+
+class _FieldCache:
+    """
+    Cache of extracted YAML fields for one repository.
+
+    Maps each (file, field selection) to the extracted values together with
+    the source's mtime_ns and size; entries are reused while that stamp
+    still matches. It is shared by every resolver in the process and kept in
+    memory only, unless ATDD_RESOLVER_CACHE=1 makes it persistent: it is then
+    also stored in the repository's .atdd/cache/ (git-ignored) and rewritten
+    atomically at interpreter exit if anything changed.
+    """
+
+    def __init__(self, repo_root: Path, persistent: bool = False):
+        self.repo_root = repo_root
+        self.path = repo_root / ".atdd" / "cache" / FIELD_CACHE_FILE
+        self.persistent = persistent
+        self.entries: Dict[str, dict] = self._load() if persistent else {}
+        self.dirty = False
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            data = json.loads(self.path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != _FIELD_CACHE_VERSION:
+            return {}
+        entries = data.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    def get(self, path: Path, wanted: frozenset) -> Optional[Dict[Tuple[str, ...], list]]:
+        """Return cached fields for ``path``, extracting and storing on a miss."""
+        st = os.stat(path)
+        stamp = [st.st_mtime_ns, st.st_size]
+        key = f"{path}|{sorted(wanted)}"
+
+        entry = self.entries.get(key)
+        if entry is not None and entry.get("stamp") == stamp:
+            fields = entry.get("fields")
+            return None if fields is None else {tuple(k): v for k, v in fields}
+
+        fields = _extract_yaml_fields(path, wanted)
+        encoded = None if fields is None else [[list(k), v] for k, v in fields.items()]
+        try:
+            json.dumps(encoded)
+        except (TypeError, ValueError):
+            # e.g. YAML timestamps; not representable in JSON, don't cache
+            return fields
+        self.entries[key] = {"stamp": stamp, "fields": encoded}
+        self.dirty = True
+        return fields
+
+    def save(self) -> None:
+        """Write the cache back to disk if it changed (best effort)."""
+        if not self.persistent or not self.dirty:
+            return
+        try:
+            atdd_cache_dir(self.repo_root)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(
+                json.dumps({"version": _FIELD_CACHE_VERSION, "entries": self.entries}),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except OSError:
+            pass
+
+
+def _field_cache(repo_root: Path) -> _FieldCache:
+    """Return the shared field cache for a repository, loading it on first use."""
+    persistent = os.environ.get("ATDD_RESOLVER_CACHE") == "1"
+    cache = _field_caches.get((repo_root, persistent))
+    if cache is None:
+        with _field_caches_lock:
+            cache = _field_caches.get((repo_root, persistent))
+            if cache is None:
+                cache = _FieldCache(repo_root, persistent)
+                _field_caches[(repo_root, persistent)] = cache
+                if persistent:
+                    atexit.register(cache.save)
+    return cache
+
 
 @dataclass
 class URNDeclaration:
@@ -88,8 +403,15 @@ class URNResolver(Protocol):
         """Resolve a URN to filesystem artifact(s)."""
         ...
 
-    def find_declarations(self) -> List[URNDeclaration]:
-        """Find all URN declarations of this family in the codebase."""
+    def find_declarations(
+        self, snapshot: Optional[FilesystemSnapshot] = None
+    ) -> List[URNDeclaration]:
+        """
+        Find all URN declarations of this family in the codebase.
+
+        ``snapshot`` is a shared repository walk; resolvers that scan the
+        whole repo read from it instead of walking again.
+        """
         ...
 
 
@@ -101,6 +423,13 @@ class BaseResolver(ABC):
         self.plan_dir = self.repo_root / "plan"
         self.contracts_dir = self.repo_root / "contracts"
         self.telemetry_dir = self.repo_root / "telemetry"
+        # (mtime_ns, names) listings keyed by parent path; see _dir_has()
+        self._dir_cache: Dict[Path, Tuple[int, frozenset[str]]] = {}
+        # Guards lazily built per-resolver indexes across threads
+        self._index_lock = threading.Lock()
+        # "{family}:", built on first can_resolve(); subclasses may only be
+        # able to compute family once their own __init__ has run
+        self._urn_prefix: Optional[str] = None
 
     @property
     @abstractmethod
@@ -110,7 +439,10 @@ class BaseResolver(ABC):
 
     def can_resolve(self, urn: str) -> bool:
         """Check if this resolver can handle the given URN."""
-        return urn.startswith(f"{self.family}:")
+        prefix = self._urn_prefix
+        if prefix is None:
+            prefix = self._urn_prefix = f"{self.family}:"
+        return urn.startswith(prefix)
 
     @abstractmethod
     def resolve(self, urn: str) -> URNResolution:
@@ -118,30 +450,145 @@ class BaseResolver(ABC):
         pass
 
     @abstractmethod
-    def find_declarations(self) -> List[URNDeclaration]:
+    def find_declarations(
+        self, snapshot: Optional[FilesystemSnapshot] = None
+    ) -> List[URNDeclaration]:
         """Find all URN declarations of this family."""
         pass
 
+    def invalidate(self) -> None:
+        """
+        Drop this resolver's cached listings and lazily built indexes.
+
+        Subclasses with their own indexes extend this; they are rebuilt on
+        next use.
+        """
+        self._dir_cache.clear()
+
+    def resolve_many(self, urns: List[str]) -> List[URNResolution]:
+        """
+        Resolve several URNs of this family, preserving input order.
+
+        Existence checks go through _dir_has(), so URNs sharing a parent
+        directory are answered from a single scandir of that directory.
+        """
+        return [self.resolve(urn) for urn in urns]
+
     # Directories pruned before recursion in os.walk
-    _SKIP_DIRS = {
+    _SKIP_DIRS = frozenset({
         ".git", "__pycache__", "node_modules", ".dart_tool",
         "build", ".pub-cache", "dist", ".next", ".nuxt", "coverage",
         ".venv", "venv", "env", ".tox", ".mypy_cache", ".pytest_cache",
-    }
+        ".atdd",
+    })
 
-    def _walk_files(self, root: Path, extensions: set[str]):
+    def _walk_names(self, root: Path, extensions: set[str], prune: bool = True):
         """
-        Walk directory tree yielding files matching extensions.
+        Walk directory tree yielding (dirpath, filename) string pairs for
+        files matching extensions.
 
         Prunes vendored/build directories *before* recursing so os.walk
-        never enters node_modules, .dart_tool, etc.
+        never enters node_modules, .dart_tool, etc.; ``prune=False`` walks
+        everything. Symlinked directories are not followed. Missing roots
+        yield nothing.
         """
-        for dirpath, dirnames, filenames in os.walk(root):
+        suffixes = tuple(extensions)
+        skip_dirs = self._SKIP_DIRS if prune else ()
+        for dirpath, dirnames, filenames in os.walk(root, followlinks=False):
             # Prune in-place so os.walk skips these subtrees entirely
-            dirnames[:] = [d for d in dirnames if d not in self._SKIP_DIRS]
+            if skip_dirs:
+                dirnames[:] = [d for d in dirnames if d not in skip_dirs]
             for fname in filenames:
-                if any(fname.endswith(ext) for ext in extensions):
-                    yield Path(dirpath) / fname
+                if fname.endswith(suffixes):
+                    yield dirpath, fname
+
+    def _walk_files(self, root: Path, extensions: set[str]):
+        """Walk directory tree yielding Paths of files matching extensions."""
+        for dirpath, fname in self._walk_names(root, extensions):
+            yield Path(dirpath) / fname
+
+    def _cached_rglob(self, root: Path, suffix: str) -> List[Path]:
+        """
+        Files under ``root`` whose name ends with ``suffix``, cached per process.
+
+        Revalidating a cached listing costs one stat per directory instead
+        of re-reading every directory, and the cache is shared by every
+        resolver instance in the process.
+        """
+        key = (root, suffix)
+        cached = _listing_cache.get(key)
+        if cached is not None:
+            stamps, paths = cached
+            try:
+                if all(os.stat(d).st_mtime_ns == m for d, m in stamps):
+                    return paths
+            except OSError:
+                pass
+
+        stamps, paths = _scan_tree(root, suffix)
+        # A missing root has nothing to revalidate against, so don't cache it
+        if stamps:
+            _listing_cache[key] = (stamps, paths)
+        return paths
+
+    def _yaml_fields(
+        self, path: Path, wanted: frozenset
+    ) -> Optional[Dict[Tuple[str, ...], list]]:
+        """_extract_yaml_fields() backed by the repository's shared field cache."""
+        return _field_cache(self.repo_root).get(path, wanted)
+
+    def _iter_wmbt_files(self):
+        """
+        Yield WMBT files (plan/{wagon}/{STEP}{NNN}.yaml).
+
+        WMBT files sit directly in wagon directories, so this lists plan/
+        and each non-underscore wagon directory once with os.scandir and
+        never descends further (e.g. into features/).
+        """
+        try:
+            with os.scandir(self.plan_dir) as wagon_entries:
+                wagon_dirs = [
+                    e.path for e in wagon_entries
+                    if not e.name.startswith("_") and e.is_dir()
+                ]
+        except OSError:
+            return
+
+        for wagon_dir in wagon_dirs:
+            try:
+                with os.scandir(wagon_dir) as entries:
+                    names = [
+                        e.name for e in entries
+                        if _WMBT_FILENAME_RE.match(e.name) and e.is_file()
+                    ]
+            except OSError:
+                continue
+            for name in names:
+                yield Path(wagon_dir, name)
+
+    def _dir_has(self, parent: Path, name: str) -> bool:
+        """
+        Check whether ``parent`` contains an entry called ``name``.
+
+        The listing of each parent is read with a single os.scandir() and
+        cached with the directory's mtime, so resolving many URNs that live
+        in the same directory costs one readdir; later lookups only stat
+        the parent and re-read it once entries are added or removed.
+        """
+        try:
+            mtime = os.stat(parent).st_mtime_ns
+        except OSError:
+            return False
+        cached = self._dir_cache.get(parent)
+        if cached is not None and cached[0] == mtime:
+            return name in cached[1]
+        try:
+            with os.scandir(parent) as entries:
+                names = frozenset(entry.name for entry in entries)
+        except OSError:
+            return False
+        self._dir_cache[parent] = (mtime, names)
+        return name in names
 
     def _validate_urn_format(self, urn: str) -> Optional[str]:
         """Validate URN format against PATTERNS. Returns error message or None."""
@@ -153,6 +600,48 @@ class BaseResolver(ABC):
         return None
 
 
+class FilesystemSnapshot:
+    """
+    One pruned walk of the repository, shared across resolvers.
+
+    ResolverRegistry.find_all_declarations() hands a snapshot to every
+    resolver so repo-wide scans (components, tests) walk the tree once
+    between them. The walk happens on first use and covers files ending in
+    any of ``suffixes``; vendored/build directories are pruned as in
+    BaseResolver._walk_names().
+    """
+
+    def __init__(self, root: Path, suffixes: set[str]):
+        self.root = root
+        self.suffixes = frozenset(suffixes)
+        self._paths: Optional[List[Path]] = None
+        self._lock = threading.Lock()
+
+    def _walk(self) -> List[Path]:
+        paths: List[Path] = []
+        suffixes = tuple(self.suffixes)
+        skip_dirs = BaseResolver._SKIP_DIRS
+        for dirpath, dirnames, filenames in os.walk(self.root, followlinks=False):
+            dirnames[:] = [d for d in dirnames if d not in skip_dirs]
+            for fname in filenames:
+                if fname.endswith(suffixes):
+                    paths.append(Path(dirpath) / fname)
+        return paths
+
+    def files(self, suffixes: set[str]) -> List[Path]:
+        """Files in walk order whose name ends with one of ``suffixes``."""
+        if not self.suffixes.issuperset(suffixes):
+            raise ValueError(f"Snapshot does not cover suffixes: {sorted(suffixes)}")
+        if self._paths is None:
+            with self._lock:
+                if self._paths is None:
+                    self._paths = self._walk()
+        if self.suffixes == suffixes:
+            return self._paths
+        wanted = tuple(suffixes)
+        return [path for path in self._paths if path.name.endswith(wanted)]
+
+
 class WagonResolver(BaseResolver):
     """
     Resolver for wagon: URNs.
@@ -160,6 +649,9 @@ class WagonResolver(BaseResolver):
     Resolution: wagon:{slug} -> plan/{slug}/_{slug}.yaml
     """
 
+    # Top-level keys read from each YAML file (see _extract_yaml_fields)
+    _FIELDS = frozenset({("wagon",)})
+
     @property
     def family(self) -> str:
         return "wagon"
@@ -173,11 +665,12 @@ class WagonResolver(BaseResolver):
             return URNResolution(urn=urn, family=self.family, error=error)
 
         slug = urn.replace("wagon:", "")
-        wagon_dir = self.plan_dir / slug.replace("-", "_")
-        manifest_path = wagon_dir / f"_{slug.replace('-', '_')}.yaml"
+        slug_norm = slug.replace("-", "_")
+        wagon_dir = self.plan_dir / slug_norm
+        manifest_path = wagon_dir / f"_{slug_norm}.yaml"
 
         paths = []
-        if manifest_path.exists():
+        if self._dir_has(wagon_dir, manifest_path.name):
             paths.append(manifest_path)
 
         return URNResolution(
@@ -188,7 +681,9 @@ class WagonResolver(BaseResolver):
             error=None if paths else f"Wagon manifest not found: {manifest_path}",
         )
 
-    def find_declarations(self) -> List[URNDeclaration]:
+    def find_declarations(
+        self, snapshot: Optional[FilesystemSnapshot] = None
+    ) -> List[URNDeclaration]:
         """Find all wagon URN declarations in manifests."""
         declarations = []
         if not self.plan_dir.exists():
@@ -196,12 +691,9 @@ class WagonResolver(BaseResolver):
 
         for manifest in self.plan_dir.rglob("_*.yaml"):
             try:
-                import yaml
-
-                with open(manifest, "r", encoding="utf-8") as f:
-                    data = yaml.safe_load(f)
-                if data and isinstance(data, dict):
-                    wagon_slug = data.get("wagon")
+                fields = self._yaml_fields(manifest, self._FIELDS)
+                if fields is not None:
+                    wagon_slug = fields.get(("wagon",), [None])[-1]
                     if wagon_slug:
                         urn = f"wagon:{wagon_slug}"
                         declarations.append(
@@ -225,6 +717,9 @@ class FeatureResolver(BaseResolver):
     Resolution: feature:{wagon}:{feature} -> plan/{wagon}/features/{feature}.yaml
     """
 
+    # Top-level keys read from each YAML file (see _extract_yaml_fields)
+    _FIELDS = frozenset({("urn",)})
+
     @property
     def family(self) -> str:
         return "feature"
@@ -245,10 +740,11 @@ class FeatureResolver(BaseResolver):
 
         wagon_slug, feature_slug = parts
         wagon_dir = self.plan_dir / wagon_slug.replace("-", "_")
-        feature_path = wagon_dir / "features" / f"{feature_slug.replace('-', '_')}.yaml"
+        feature_norm = feature_slug.replace("-", "_")
+        feature_path = wagon_dir / "features" / f"{feature_norm}.yaml"
 
         paths = []
-        if feature_path.exists():
+        if self._dir_has(feature_path.parent, feature_path.name):
             paths.append(feature_path)
 
         return URNResolution(
@@ -259,7 +755,9 @@ class FeatureResolver(BaseResolver):
             error=None if paths else f"Feature file not found: {feature_path}",
         )
 
-    def find_declarations(self) -> List[URNDeclaration]:
+    def find_declarations(
+        self, snapshot: Optional[FilesystemSnapshot] = None
+    ) -> List[URNDeclaration]:
         """Find all feature URN declarations in feature files."""
         declarations = []
         if not self.plan_dir.exists():
@@ -267,12 +765,9 @@ class FeatureResolver(BaseResolver):
 
         for feature_file in self.plan_dir.rglob("features/*.yaml"):
             try:
-                import yaml
-
-                with open(feature_file, "r", encoding="utf-8") as f:
-                    data = yaml.safe_load(f)
-                if data and isinstance(data, dict):
-                    feature_urn = data.get("urn")
+                fields = self._yaml_fields(feature_file, self._FIELDS)
+                if fields is not None:
+                    feature_urn = fields.get(("urn",), [None])[-1]
                     if feature_urn and feature_urn.startswith("feature:"):
                         declarations.append(
                             URNDeclaration(
@@ -295,6 +790,9 @@ class WMBTResolver(BaseResolver):
     Resolution: wmbt:{wagon}:{STEP}{NNN} -> plan/{wagon}/{STEP}{NNN}.yaml
     """
 
+    # Shared with AcceptanceResolver (see _WMBT_FIELDS)
+    _FIELDS = _WMBT_FIELDS
+
     @property
     def family(self) -> str:
         return "wmbt"
@@ -318,7 +816,7 @@ class WMBTResolver(BaseResolver):
         wmbt_path = wagon_dir / f"{step_id}.yaml"
 
         paths = []
-        if wmbt_path.exists():
+        if self._dir_has(wagon_dir, wmbt_path.name):
             paths.append(wmbt_path)
 
         return URNResolution(
@@ -329,39 +827,27 @@ class WMBTResolver(BaseResolver):
             error=None if paths else f"WMBT file not found: {wmbt_path}",
         )
 
-    def find_declarations(self) -> List[URNDeclaration]:
+    def find_declarations(
+        self, snapshot: Optional[FilesystemSnapshot] = None
+    ) -> List[URNDeclaration]:
         """Find all WMBT URN declarations in WMBT files."""
         declarations = []
-        if not self.plan_dir.exists():
-            return declarations
-
-        wmbt_pattern = re.compile(r"^[DLPCEMYRK]\d{3}\.yaml$")
-        for wagon_dir in self.plan_dir.iterdir():
-            if not wagon_dir.is_dir() or wagon_dir.name.startswith("_"):
-                continue
-
-            for wmbt_file in wagon_dir.glob("*.yaml"):
-                if not wmbt_pattern.match(wmbt_file.name):
-                    continue
-
-                try:
-                    import yaml
-
-                    with open(wmbt_file, "r", encoding="utf-8") as f:
-                        data = yaml.safe_load(f)
-                    if data and isinstance(data, dict):
-                        wmbt_urn = data.get("urn")
-                        if wmbt_urn and wmbt_urn.startswith("wmbt:"):
-                            declarations.append(
-                                URNDeclaration(
-                                    urn=wmbt_urn,
-                                    family=self.family,
-                                    source_path=wmbt_file,
-                                    context="WMBT file",
-                                )
+        for wmbt_file in self._iter_wmbt_files():
+            try:
+                fields = self._yaml_fields(wmbt_file, self._FIELDS)
+                if fields is not None:
+                    wmbt_urn = fields.get(("urn",), [None])[-1]
+                    if wmbt_urn and wmbt_urn.startswith("wmbt:"):
+                        declarations.append(
+                            URNDeclaration(
+                                urn=wmbt_urn,
+                                family=self.family,
+                                source_path=wmbt_file,
+                                context="WMBT file",
                             )
-                except Exception:
-                    continue
+                        )
+            except Exception:
+                continue
 
         return declarations
 
@@ -373,6 +859,9 @@ class AcceptanceResolver(BaseResolver):
     Resolution: acc:{wagon}:{wmbt_id}-{harness}-{seq} -> WMBT YAML acceptance blocks
     """
 
+    # Shared with WMBTResolver (see _WMBT_FIELDS)
+    _FIELDS = _WMBT_FIELDS
+
     @property
     def family(self) -> str:
         return "acc"
@@ -385,7 +874,7 @@ class AcceptanceResolver(BaseResolver):
         if error:
             return URNResolution(urn=urn, family=self.family, error=error)
 
-        parsed = URNBuilder.parse_urn(urn)
+        parsed = _parse_urn(urn)
         wagon_slug = parsed.get("wagon_id")
         wmbt_id = parsed.get("wmbt_id")
 
@@ -398,7 +887,7 @@ class AcceptanceResolver(BaseResolver):
         wmbt_path = wagon_dir / f"{wmbt_id}.yaml"
 
         paths = []
-        if wmbt_path.exists():
+        if self._dir_has(wagon_dir, wmbt_path.name):
             paths.append(wmbt_path)
 
         return URNResolution(
@@ -409,40 +898,27 @@ class AcceptanceResolver(BaseResolver):
             error=None if paths else f"WMBT file for acceptance not found: {wmbt_path}",
         )
 
-    def find_declarations(self) -> List[URNDeclaration]:
+    def find_declarations(
+        self, snapshot: Optional[FilesystemSnapshot] = None
+    ) -> List[URNDeclaration]:
         """Find all acceptance URN declarations in WMBT files."""
         declarations = []
-        if not self.plan_dir.exists():
-            return declarations
-
-        wmbt_pattern = re.compile(r"^[DLPCEMYRK]\d{3}\.yaml$")
-        for wagon_dir in self.plan_dir.iterdir():
-            if not wagon_dir.is_dir() or wagon_dir.name.startswith("_"):
-                continue
-
-            for wmbt_file in wagon_dir.glob("*.yaml"):
-                if not wmbt_pattern.match(wmbt_file.name):
-                    continue
-
-                try:
-                    import yaml
-
-                    with open(wmbt_file, "r", encoding="utf-8") as f:
-                        data = yaml.safe_load(f)
-                    if data and isinstance(data, dict):
-                        for acc in data.get("acceptances", []):
-                            acc_urn = acc.get("identity", {}).get("urn")
-                            if acc_urn and acc_urn.startswith("acc:"):
-                                declarations.append(
-                                    URNDeclaration(
-                                        urn=acc_urn,
-                                        family=self.family,
-                                        source_path=wmbt_file,
-                                        context="acceptance block",
-                                    )
+        for wmbt_file in self._iter_wmbt_files():
+            try:
+                fields = self._yaml_fields(wmbt_file, self._FIELDS)
+                if fields is not None:
+                    for acc_urn in fields.get(_ACC_URN_PATH, []):
+                        if acc_urn and acc_urn.startswith("acc:"):
+                            declarations.append(
+                                URNDeclaration(
+                                    urn=acc_urn,
+                                    family=self.family,
+                                    source_path=wmbt_file,
+                                    context="acceptance block",
                                 )
-                except Exception:
-                    continue
+                            )
+            except Exception:
+                continue
 
         return declarations
 
@@ -454,6 +930,14 @@ class ContractResolver(BaseResolver):
     Resolution: contract:{domain}:{resource} -> contracts/{domain}/{resource}.schema.json
     """
 
+    def __init__(self, repo_root: Optional[Path] = None):
+        super().__init__(repo_root)
+        # Lazily built on first use; see _ensure_index()
+        self._contract_index: Optional[Dict[str, List[Path]]] = None
+        self._contract_ids: List[Tuple[Path, str]] = []
+        # Files indexed by path only, whose JSON has not been parsed yet
+        self._unparsed_contracts: set[Path] = set()
+
     @property
     def family(self) -> str:
         return "contract"
@@ -477,82 +961,108 @@ class ContractResolver(BaseResolver):
             error=None if paths else f"Contract schema not found for: {urn}",
         )
 
-    def _find_contract_files(self, contract_id: str) -> List[Path]:
-        """Find contract files matching the ID using multiple strategies."""
-        paths = []
-        if not self.contracts_dir.exists():
-            return paths
-
-        for contract_file in self.contracts_dir.rglob("*.schema.json"):
-            try:
-                import json
-
-                with open(contract_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+    def _ensure_index(self) -> Dict[str, List[Path]]:
+        """
+        Build the contract lookup index once per resolver instance.
 
-                file_id = data.get("$id", "")
+        Each schema file is parsed a single time and registered under three
+        keys, one per matching strategy:
+        - ``id:{$id}``       exact $id match
+        - ``norm:{$id}``     $id with dots normalized to colons
+        - ``path:{relpath}`` path relative to contracts/ without suffix
 
-                # Skip urn:jel:* IDs (JEL package headers, not ATDD contracts)
-                if file_id.startswith("urn:jel:"):
-                    continue
+        Files whose bytes contain no ``"$id"`` key can only match by path, so
+        they are not parsed here; _find_contract_files() checks them lazily.
+        """
+        if self._contract_index is None:
+            with self._index_lock:
+                if self._contract_index is None:
+                    self._contract_index = self._build_index()
+        return self._contract_index
+
+    def invalidate(self) -> None:
+        super().invalidate()
+        self._contract_index = None
+
+    def _build_index(self) -> Dict[str, List[Path]]:
+        """Scan contracts/ for _ensure_index()."""
+        index: Dict[str, List[Path]] = {}
+        ids: List[Tuple[Path, str]] = []
+        if self.contracts_dir.exists():
+            for contract_file in self.contracts_dir.rglob("*.schema.json"):
+                try:
+                    raw = contract_file.read_bytes()
+                    if b'"$id"' in raw:
+                        data = json.loads(raw)
+                        file_id = data.get("$id", "")
+                    else:
+                        self._unparsed_contracts.add(contract_file)
+                        file_id = ""
 
-                # Strategy 1: Exact match
-                if file_id == contract_id:
-                    paths.append(contract_file)
-                    continue
+                    # Skip urn:jel:* IDs (JEL package headers, not ATDD contracts)
+                    if file_id.startswith("urn:jel:"):
+                        continue
 
-                # Strategy 2: Normalized match (colon vs dot)
-                normalized_file_id = file_id.replace(".", ":")
-                normalized_contract_id = contract_id.replace(".", ":")
-                if normalized_file_id == normalized_contract_id:
-                    paths.append(contract_file)
+                    contract_path = str(
+                        contract_file.relative_to(self.contracts_dir)
+                    ).replace(".schema.json", "")
+                except Exception:
                     continue
 
-                # Strategy 3: Path-based match
-                contract_path = str(
-                    contract_file.relative_to(self.contracts_dir)
-                ).replace(".schema.json", "")
-                urn_path = contract_id.replace(":", "/")
-                if contract_path == urn_path:
-                    paths.append(contract_file)
-                    continue
+                if file_id:
+                    ids.append((contract_file, file_id))
+                for key in (
+                    f"id:{file_id}",
+                    f"norm:{file_id.replace('.', ':')}",
+                    f"path:{contract_path}",
+                ):
+                    index.setdefault(key, []).append(contract_file)
 
-            except Exception:
-                continue
+        self._contract_ids = ids
+        return index
 
-        return paths
-
-    def find_declarations(self) -> List[URNDeclaration]:
+    def _find_contract_files(self, contract_id: str) -> List[Path]:
+        """Find contract files matching the ID using multiple strategies."""
+        index = self._ensure_index()
+        # Strategy order: exact, normalized (colon vs dot), path-based
+        matches = (
+            index.get(f"id:{contract_id}", [])
+            + index.get(f"norm:{contract_id.replace('.', ':')}", [])
+            + [
+                path
+                for path in index.get(f"path:{contract_id.replace(':', '/')}", [])
+                if self._is_parsable_contract(path)
+            ]
+        )
+        return list(dict.fromkeys(matches))
+
+    def _is_parsable_contract(self, contract_file: Path) -> bool:
+        """Confirm a path-only index entry holds a JSON object (parsed on demand)."""
+        if contract_file not in self._unparsed_contracts:
+            return True
+
+        try:
+            data = json.loads(contract_file.read_bytes())
+            data.get("$id", "")
+        except Exception:
+            return False
+        self._unparsed_contracts.discard(contract_file)
+        return True
+
+    def find_declarations(
+        self, snapshot: Optional[FilesystemSnapshot] = None
+    ) -> List[URNDeclaration]:
         """Find all contract URN declarations in contract schema files."""
-        declarations = []
-        if not self.contracts_dir.exists():
-            return declarations
-
-        import json
-
-        for contract_file in self.contracts_dir.rglob("*.schema.json"):
-            try:
-                with open(contract_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                contract_id = data.get("$id")
-                # Skip urn:jel:* IDs (JEL package headers, not ATDD contracts)
-                if contract_id and contract_id.startswith("urn:jel:"):
-                    continue
-                if contract_id:
-                    urn = f"contract:{contract_id}"
-                    declarations.append(
-                        URNDeclaration(
-                            urn=urn,
-                            family=self.family,
-                            source_path=contract_file,
-                            context="contract schema",
-                        )
-                    )
-            except Exception:
-                continue
-
-        return declarations
+        self._ensure_index()
+        return [
+            URNDeclaration(
+                urn=f"contract:{contract_id}",
+                family=self.family,
+                source_path=contract_file,
+                context="contract schema",
+            )
+            for contract_file, contract_id in self._contract_ids
+        ]
 
 
 class TelemetryResolver(BaseResolver):
@@ -562,6 +1072,9 @@ class TelemetryResolver(BaseResolver):
     Resolution: telemetry:{wagon}.{signal} -> telemetry/{wagon}/{signal}.yaml
     """
 
+    # Top-level keys read from each YAML file (see _extract_yaml_fields)
+    _FIELDS = frozenset({("$id",), ("id",)})
+
     @property
     def family(self) -> str:
         return "telemetry"
@@ -593,12 +1106,11 @@ class TelemetryResolver(BaseResolver):
 
         for telemetry_file in self.telemetry_dir.rglob("*.yaml"):
             try:
-                import yaml
-
-                with open(telemetry_file, "r", encoding="utf-8") as f:
-                    data = yaml.safe_load(f)
+                fields = self._yaml_fields(telemetry_file, self._FIELDS)
+                if fields is None:
+                    continue
 
-                file_id = data.get("$id") or data.get("id", "")
+                file_id = fields.get(("$id",), [None])[-1] or fields.get(("id",), [""])[-1]
 
                 # Match against telemetry ID
                 if file_id == telemetry_id:
@@ -612,8 +1124,6 @@ class TelemetryResolver(BaseResolver):
         # Also check JSON files
         for telemetry_file in self.telemetry_dir.rglob("*.json"):
             try:
-                import json
-
                 with open(telemetry_file, "r", encoding="utf-8") as f:
                     data = json.load(f)
 
@@ -627,21 +1137,21 @@ class TelemetryResolver(BaseResolver):
 
         return paths
 
-    def find_declarations(self) -> List[URNDeclaration]:
+    def find_declarations(
+        self, snapshot: Optional[FilesystemSnapshot] = None
+    ) -> List[URNDeclaration]:
         """Find all telemetry URN declarations."""
         declarations = []
         if not self.telemetry_dir.exists():
             return declarations
 
-        import yaml
-        import json
-
         for telemetry_file in self.telemetry_dir.rglob("*.yaml"):
             try:
-                with open(telemetry_file, "r", encoding="utf-8") as f:
-                    data = yaml.safe_load(f)
+                fields = self._yaml_fields(telemetry_file, self._FIELDS)
+                if fields is None:
+                    continue
 
-                telemetry_id = data.get("$id") or data.get("id")
+                telemetry_id = fields.get(("$id",), [None])[-1] or fields.get(("id",), [None])[-1]
                 if telemetry_id:
                     urn = (
                         telemetry_id
@@ -692,6 +1202,9 @@ class TrainResolver(BaseResolver):
     Resolution: train:{NNNN}-{slug} -> plan/_trains/{id}.yaml
     """
 
+    # Top-level keys read from each YAML file (see _extract_yaml_fields)
+    _FIELDS = frozenset({("id",)})
+
     @property
     def family(self) -> str:
         return "train"
@@ -709,7 +1222,7 @@ class TrainResolver(BaseResolver):
         train_path = trains_dir / f"{train_id}.yaml"
 
         paths = []
-        if train_path.exists():
+        if self._dir_has(trains_dir, train_path.name):
             paths.append(train_path)
 
         return URNResolution(
@@ -720,22 +1233,20 @@ class TrainResolver(BaseResolver):
             error=None if paths else f"Train file not found: {train_path}",
         )
 
-    def find_declarations(self) -> List[URNDeclaration]:
+    def find_declarations(
+        self, snapshot: Optional[FilesystemSnapshot] = None
+    ) -> List[URNDeclaration]:
         """Find all train URN declarations."""
         declarations = []
         trains_dir = self.plan_dir / "_trains"
         if not trains_dir.exists():
             return declarations
 
-        import yaml
-
         for train_file in trains_dir.glob("*.yaml"):
             try:
-                with open(train_file, "r", encoding="utf-8") as f:
-                    data = yaml.safe_load(f)
-
-                if data and isinstance(data, dict):
-                    train_id = data.get("id") or train_file.stem
+                fields = self._yaml_fields(train_file, self._FIELDS)
+                if fields is not None:
+                    train_id = fields.get(("id",), [None])[-1] or train_file.stem
                     urn = f"train:{train_id}"
                     declarations.append(
                         URNDeclaration(
@@ -758,6 +1269,18 @@ class ComponentResolver(BaseResolver):
     Resolution: component:{wagon}:{feature}:{name}:{side}:{layer} -> code files
     """
 
+    _CODE_EXTENSIONS = {".py", ".dart", ".ts", ".tsx"}
+    # Result order of _find_component_files(), grouped by extension
+    _COMPONENT_SUFFIX_ORDER = {".py": 0, ".dart": 1, ".ts": 2, ".tsx": 3}
+
+    # Support both # and // comment styles, case-insensitive URN:
+    # (bytes pattern; horizontal whitespace only so matches never span lines)
+    _URN_COMMENT_RE = re.compile(
+        rb"(?:#|//)[^\S\n]*[Uu][Rr][Nn]:[^\S\n]*(component:[^\s]+)"
+    )
+    # Filter out regex patterns that are not actual URNs
+    _REGEX_META_RE = re.compile(rb"[\[\]\(\)\*\+\?\{\}\^\$\\]")
+
     @property
     def family(self) -> str:
         return "component"
@@ -770,7 +1293,7 @@ class ComponentResolver(BaseResolver):
         if error:
             return URNResolution(urn=urn, family=self.family, error=error)
 
-        parsed = URNBuilder.parse_urn(urn)
+        parsed = _parse_urn(urn)
         wagon_id = parsed.get("wagon_id")
         feature_id = parsed.get("feature_id")
         component_name = parsed.get("component_name")
@@ -795,9 +1318,13 @@ class ComponentResolver(BaseResolver):
         )
 
     @staticmethod
-    def _stem_match(component_name: str, file_path: Path) -> bool:
-        """Case-insensitive exact stem match (not substring) for deterministic resolution."""
-        stem = file_path.stem.lower()
+    def _stem_targets(component_name: str) -> frozenset[str]:
+        """
+        Lowercase file stems a component name resolves to.
+
+        Matching is a case-insensitive exact stem match (not substring) for
+        deterministic resolution; compute once per lookup, not per file.
+        """
         # Normalize component name: PascalCase -> snake_case, dots -> underscores
         target = component_name.replace('.', '_')
         # Insert underscore before uppercase runs: "TrainRunner" -> "Train_Runner"
@@ -806,7 +1333,7 @@ class ComponentResolver(BaseResolver):
         target = target.lower()
         # Also try direct lowercase (for already-lowercase names)
         direct = component_name.lower().replace('.', '_').replace('-', '_')
-        return stem == target or stem == direct
+        return frozenset((target, direct))
 
     def _find_component_files(
         self,
@@ -836,6 +1363,10 @@ class ComponentResolver(BaseResolver):
             "assembly": ["assembly", ""],
         }
 
+        wagon_norm = wagon_id.replace("-", "_")
+        feature_norm = feature_id.replace("-", "_")
+        targets = self._stem_targets(component_name)
+
         for side_dir in side_dirs.get(side, []):
             base_dir = self.repo_root / side_dir
             if not base_dir.exists():
@@ -843,25 +1374,31 @@ class ComponentResolver(BaseResolver):
 
             for layer_dir in layer_dirs.get(layer, []):
                 search_paths = [
-                    base_dir / wagon_id.replace("-", "_") / feature_id.replace("-", "_") / layer_dir,
-                    base_dir / wagon_id.replace("-", "_") / feature_id.replace("-", "_") / "src" / layer_dir,
-                    base_dir / "features" / feature_id.replace("-", "_") / layer_dir,
-                    base_dir / wagon_id.replace("-", "_") / layer_dir,
+                    base_dir / wagon_norm / feature_norm / layer_dir,
+                    base_dir / wagon_norm / feature_norm / "src" / layer_dir,
+                    base_dir / "features" / feature_norm / layer_dir,
+                    base_dir / wagon_norm / layer_dir,
                 ]
                 # For assembly, also check the feature root without layer subdir
                 if layer == "assembly":
                     search_paths.append(
-                        base_dir / wagon_id.replace("-", "_") / feature_id.replace("-", "_")
+                        base_dir / wagon_norm / feature_norm
                     )
 
                 for search_path in search_paths:
-                    if not search_path.exists():
-                        continue
-
-                    for ext in ["*.py", "*.dart", "*.ts", "*.tsx"]:
-                        for f in search_path.rglob(ext):
-                            if self._stem_match(component_name, f):
-                                paths.append(f)
+                    # One unpruned walk per search path (component code may
+                    # live under e.g. build/ or env/), filtering extensions in
+                    # memory; a Path is only built for files whose stem matches.
+                    found = [
+                        Path(dirpath) / fname
+                        for dirpath, fname in self._walk_names(
+                            search_path, self._CODE_EXTENSIONS, prune=False
+                        )
+                        if os.path.splitext(fname)[0].lower() in targets
+                    ]
+                    # Same order as one rglob per extension: .py, .dart, .ts, .tsx
+                    found.sort(key=lambda f: self._COMPONENT_SUFFIX_ORDER[f.suffix])
+                    paths.extend(found)
 
         return paths
 
@@ -882,56 +1419,101 @@ class ComponentResolver(BaseResolver):
             trains_dir,
         ]
 
+        targets = self._stem_targets(component_name)
+        suffixes = tuple(self._CODE_EXTENSIONS)
         for search_path in search_paths:
-            if not search_path.exists():
+            # Single listing per directory instead of one glob per extension
+            try:
+                with os.scandir(search_path) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if name.endswith(suffixes) and os.path.splitext(name)[0].lower() in targets:
+                            paths.append(search_path / name)
+            except OSError:
                 continue
-            for ext in ["*.py", "*.dart", "*.ts", "*.tsx"]:
-                for f in search_path.glob(ext):
-                    if self._stem_match(component_name, f):
-                        paths.append(f)
 
         return paths
 
-    def find_declarations(self) -> List[URNDeclaration]:
+    def find_declarations(
+        self, snapshot: Optional[FilesystemSnapshot] = None
+    ) -> List[URNDeclaration]:
         """Find all component URN declarations in code files."""
         declarations = []
-        # Support both # and // comment styles, case-insensitive URN:
-        urn_pattern = re.compile(r"(?:#|//)\s*[Uu][Rr][Nn]:\s*(component:[^\s]+)")
-        # Filter out regex patterns that are not actual URNs
-        regex_metacharacters = re.compile(r"[\[\]\(\)\*\+\?\{\}\^\$\\]")
 
-        for code_file in self._walk_files(self.repo_root, {".py", ".dart", ".ts", ".tsx"}):
+        if snapshot is not None:
+            code_files = snapshot.files(self._CODE_EXTENSIONS)
+        else:
+            code_files = self._walk_files(self.repo_root, self._CODE_EXTENSIONS)
+        for code_file in code_files:
             try:
-                content = code_file.read_text(encoding="utf-8")
-                for line_num, line in enumerate(content.split("\n"), 1):
-                    match = urn_pattern.search(line)
-                    if match:
-                        urn_candidate = match.group(1)
-                        # Skip regex patterns that are not actual URNs
-                        if regex_metacharacters.search(urn_candidate):
-                            continue
-                        declarations.append(
-                            URNDeclaration(
-                                urn=urn_candidate,
-                                family=self.family,
-                                source_path=code_file,
-                                line_number=line_num,
-                                context="code comment",
-                            )
-                        )
+                data = code_file.read_bytes()
             except Exception:
                 continue
 
+            # Most code files carry no URN comment; every match must contain
+            # the literal "component:", so a C-level substring test rejects
+            # them without running the regex.
+            if b"component:" not in data:
+                continue
+
+            # Scan the whole buffer once; line numbers are derived by counting
+            # newlines between consecutive matches instead of splitting lines.
+            line_num = 1
+            last_pos = 0
+            last_line = 0
+            for match in self._URN_COMMENT_RE.finditer(data):
+                line_num += data.count(b"\n", last_pos, match.start())
+                last_pos = match.start()
+                # Only the first URN comment on a line counts
+                if line_num == last_line:
+                    continue
+                last_line = line_num
+
+                urn_candidate = match.group(1)
+                # Skip regex patterns that are not actual URNs
+                if self._REGEX_META_RE.search(urn_candidate):
+                    continue
+                try:
+                    urn = urn_candidate.decode("utf-8")
+                except UnicodeDecodeError:
+                    continue
+                declarations.append(
+                    URNDeclaration(
+                        urn=urn,
+                        family=self.family,
+                        source_path=code_file,
+                        line_number=line_num,
+                        context="code comment",
+                    )
+                )
+
         return declarations
 
 
+@dataclass
+class _SQLFileInfo:
+    """One SQL file as seen by TableResolver's index."""
+    path: Path
+    stem: str
+    tables: List[str] = field(default_factory=list)
+
+
 class TableResolver(BaseResolver):
     """
     Resolver for table: URNs.
 
     Resolution: table:{table_name} -> supabase/migrations/**/tables/{table_name}.sql
+
+    A SQL file also declares every table named by one of its CREATE TABLE
+    statements. Schema qualifiers and quotes are dropped, so
+    ``CREATE TABLE public."users"`` declares table:users.
     """
 
+    def __init__(self, repo_root: Optional[Path] = None):
+        super().__init__(repo_root)
+        # Lazily built on first use; see _ensure_index()
+        self._sql_index: Optional[List[_SQLFileInfo]] = None
+
     @property
     def family(self) -> str:
         return "table"
@@ -955,56 +1537,67 @@ class TableResolver(BaseResolver):
             error=None if paths else f"Table definition not found: {table_name}",
         )
 
-    def _find_table_files(self, table_name: str) -> List[Path]:
-        """Find SQL files defining the table."""
-        paths = []
-        supabase_dir = self.repo_root / "supabase"
-        if not supabase_dir.exists():
-            return paths
+    def _ensure_index(self) -> List[_SQLFileInfo]:
+        """
+        Read every SQL file under supabase/ once per resolver instance.
 
-        # Search in migrations for table definitions
-        for sql_file in supabase_dir.rglob("*.sql"):
-            if table_name in sql_file.stem.lower():
-                paths.append(sql_file)
-                continue
+        Both resolve() and find_declarations() are served from this index,
+        so resolving K table URNs costs one pass over the files instead of
+        K + 1 passes.
+        """
+        if self._sql_index is None:
+            with self._index_lock:
+                if self._sql_index is None:
+                    self._sql_index = self._build_index()
+        return self._sql_index
+
+    def invalidate(self) -> None:
+        super().invalidate()
+        self._sql_index = None
+
+    def _build_index(self) -> List[_SQLFileInfo]:
+        """Scan supabase/ for _ensure_index()."""
+        # A missing supabase/ simply lists no files; no separate exists() check
+        paths = self._cached_rglob(self.repo_root / "supabase", ".sql")
+        return [
+            _SQLFileInfo(path=sql_file, stem=sql_file.stem.lower(), tables=tables)
+            for sql_file, tables in _read_files_parallel(paths, reader=_scan_table_names)
+        ]
 
-            # Also check file content for CREATE TABLE
-            try:
-                content = sql_file.read_text(encoding="utf-8")
-                if f"create table" in content.lower() and table_name in content.lower():
-                    paths.append(sql_file)
-            except Exception:
-                continue
+    def _find_table_files(self, table_name: str) -> List[Path]:
+        """
+        Find SQL files defining the table.
+
+        A file matches when its name contains table_name or one of its
+        CREATE TABLE statements names the table exactly (case-insensitive,
+        ignoring any schema). Files that merely mention the name elsewhere,
+        e.g. in a foreign key, no longer match.
+        """
+        table_name_lower = table_name.lower()
+        paths = []
+        for info in self._ensure_index():
+            # Filename match, else a CREATE TABLE naming this table
+            if table_name in info.stem or any(
+                t.lower() == table_name_lower for t in info.tables
+            ):
+                paths.append(info.path)
 
         return paths
 
-    def find_declarations(self) -> List[URNDeclaration]:
+    def find_declarations(
+        self, snapshot: Optional[FilesystemSnapshot] = None
+    ) -> List[URNDeclaration]:
         """Find all table URN declarations in SQL files."""
-        declarations = []
-        supabase_dir = self.repo_root / "supabase"
-        if not supabase_dir.exists():
-            return declarations
-
-        table_pattern = re.compile(r"create\s+table\s+(?:if\s+not\s+exists\s+)?(\w+)", re.IGNORECASE)
-
-        for sql_file in supabase_dir.rglob("*.sql"):
-            try:
-                content = sql_file.read_text(encoding="utf-8")
-                for match in table_pattern.finditer(content):
-                    table_name = match.group(1)
-                    urn = f"table:{table_name}"
-                    declarations.append(
-                        URNDeclaration(
-                            urn=urn,
-                            family=self.family,
-                            source_path=sql_file,
-                            context="CREATE TABLE statement",
-                        )
-                    )
-            except Exception:
-                continue
-
-        return declarations
+        return [
+            URNDeclaration(
+                urn=f"table:{table_name}",
+                family=self.family,
+                source_path=info.path,
+                context="CREATE TABLE statement",
+            )
+            for info in self._ensure_index()
+            for table_name in info.tables
+        ]
 
 
 class MigrationResolver(BaseResolver):
@@ -1014,11 +1607,53 @@ class MigrationResolver(BaseResolver):
     Resolution: migration:{timestamp}_{name} -> supabase/migrations/{timestamp}_{name}.sql
     """
 
+    def __init__(self, repo_root: Optional[Path] = None):
+        super().__init__(repo_root)
+        # *.sql names in migrations/, rebuilt when it changes; see _ensure_index()
+        self._names: Optional[frozenset[str]] = None
+        self._dir_mtime: int = 0
+
     @property
     def family(self) -> str:
         return "migration"
 
+    def _ensure_index(self) -> frozenset[str]:
+        """
+        Collect *.sql file names from a single scandir of supabase/migrations.
+
+        The set is reused while the directory's mtime is unchanged, so
+        resolve() is a set lookup rather than a stat per URN. Only names are
+        kept; Paths are built for hits.
+        """
+        migrations_dir = self.repo_root / "supabase" / "migrations"
+        try:
+            mtime = os.stat(migrations_dir).st_mtime_ns
+        except OSError:
+            self._names = None
+            return frozenset()
+
+        with self._index_lock:
+            if self._names is None or mtime != self._dir_mtime:
+                with os.scandir(migrations_dir) as entries:
+                    self._names = frozenset(
+                        entry.name for entry in entries if entry.name.endswith(".sql")
+                    )
+                self._dir_mtime = mtime
+            return self._names
+
+    def invalidate(self) -> None:
+        super().invalidate()
+        self._names = None
+
     def resolve(self, urn: str) -> URNResolution:
+        return self._resolve_in(urn, self._ensure_index())
+
+    def resolve_many(self, urns: List[str]) -> List[URNResolution]:
+        """Resolve a batch against one snapshot of the migration index."""
+        names = self._ensure_index()
+        return [self._resolve_in(urn, names) for urn in urns]
+
+    def _resolve_in(self, urn: str, names: frozenset[str]) -> URNResolution:
         if not self.can_resolve(urn):
             return URNResolution(urn=urn, family=self.family, error="Not a migration URN")
 
@@ -1027,11 +1662,12 @@ class MigrationResolver(BaseResolver):
             return URNResolution(urn=urn, family=self.family, error=error)
 
         migration_id = urn.replace("migration:", "")
-        migrations_dir = self.repo_root / "supabase" / "migrations"
-        migration_path = migrations_dir / f"{migration_id}.sql"
+
+        filename = f"{migration_id}.sql"
+        migration_path = self.repo_root / "supabase" / "migrations" / filename
 
         paths = []
-        if migration_path.exists():
+        if filename in names:
             paths.append(migration_path)
 
         return URNResolution(
@@ -1042,17 +1678,18 @@ class MigrationResolver(BaseResolver):
             error=None if paths else f"Migration file not found: {migration_path}",
         )
 
-    def find_declarations(self) -> List[URNDeclaration]:
+    def find_declarations(
+        self, snapshot: Optional[FilesystemSnapshot] = None
+    ) -> List[URNDeclaration]:
         """Find all migration URN declarations in migration files."""
         declarations = []
         migrations_dir = self.repo_root / "supabase" / "migrations"
-        if not migrations_dir.exists():
-            return declarations
-
-        migration_pattern = re.compile(r"^(\d{14}_[a-z][a-z0-9_]*)\.sql$")
-
-        for migration_file in migrations_dir.glob("*.sql"):
-            match = migration_pattern.match(migration_file.name)
+        # The index is a set; sort for a stable declaration order
+        for name in sorted(self._ensure_index()):
+            # Cheap {14 digits}_ prefix test before running the regex
+            if len(name) < 20 or name[14] != "_" or not name[:14].isdigit():
+                continue
+            match = _MIGRATION_FILENAME_RE.match(name)
             if match:
                 migration_id = match.group(1)
                 urn = f"migration:{migration_id}"
@@ -1060,7 +1697,7 @@ class MigrationResolver(BaseResolver):
                     URNDeclaration(
                         urn=urn,
                         family=self.family,
-                        source_path=migration_file,
+                        source_path=migrations_dir / name,
                         context="migration file",
                     )
                 )
@@ -1200,12 +1837,14 @@ class TestResolver(BaseResolver):
 
         return result
 
-    def find_declarations(self) -> List[URNDeclaration]:
+    def find_declarations(
+        self, snapshot: Optional[FilesystemSnapshot] = None
+    ) -> List[URNDeclaration]:
         """Find all test URN declarations in test files."""
         declarations = []
         seen_urns: Dict[str, URNDeclaration] = {}
 
-        for test_file in self._iter_test_files():
+        for test_file in self._iter_test_files(snapshot):
             try:
                 content = test_file.read_text(encoding="utf-8")
             except Exception:
@@ -1246,24 +1885,38 @@ class TestResolver(BaseResolver):
         re.compile(r"^.*\.spec\.ts$"),
     ]
 
-    def _iter_test_files(self):
+    def _iter_test_files(self, snapshot: Optional[FilesystemSnapshot] = None):
         """Yield test files matching known patterns, pruning vendored dirs."""
-        for fpath in self._walk_files(
-            self.repo_root, {".py", ".dart", ".ts", ".tsx"}
-        ):
+        extensions = {".py", ".dart", ".ts", ".tsx"}
+        if snapshot is not None:
+            candidates = snapshot.files(extensions)
+        else:
+            candidates = self._walk_files(self.repo_root, extensions)
+        for fpath in candidates:
             if any(p.match(fpath.name) for p in self._TEST_PATTERNS):
                 yield fpath
 
+
+@functools.lru_cache(maxsize=None)
+def _accepts_snapshot(resolver_cls: type) -> bool:
+    """Whether find_declarations() takes a snapshot (custom resolvers may not)."""
+    return "snapshot" in inspect.signature(resolver_cls.find_declarations).parameters
+
+
 class ResolverRegistry:
     """
     Registry coordinating all URN resolvers.
 
     Provides unified interface for resolving URNs across all families.
+    Resolutions are memoized in a bounded LRU; call invalidate() after the
+    repository changes.
     """
 
     def __init__(self, repo_root: Optional[Path] = None):
         self.repo_root = repo_root or find_repo_root()
         self._resolvers: Dict[str, BaseResolver] = {}
+        self._resolve_cache: "OrderedDict[str, URNResolution]" = OrderedDict()
+        self._cache_size = 2048
         self._register_default_resolvers()
 
     def _register_default_resolvers(self) -> None:
@@ -1287,6 +1940,19 @@ class ResolverRegistry:
     def register(self, resolver: BaseResolver) -> None:
         """Register a custom resolver."""
         self._resolvers[resolver.family] = resolver
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Drop all memoized resolutions and every resolver's cached indexes."""
+        self._resolve_cache.clear()
+        for resolver in self._resolvers.values():
+            resolver.invalidate()
+
+    def _cache_put(self, urn: str, resolution: URNResolution) -> None:
+        cache = self._resolve_cache
+        cache[urn] = resolution
+        if len(cache) > self._cache_size:
+            cache.popitem(last=False)
 
     def get_resolver(self, family: str) -> Optional[BaseResolver]:
         """Get resolver for a specific family."""
@@ -1294,9 +1960,8 @@ class ResolverRegistry:
 
     def get_family(self, urn: str) -> Optional[str]:
         """Extract family from URN."""
-        if ":" not in urn:
-            return None
-        return urn.split(":")[0]
+        family, sep, _ = urn.partition(":")
+        return family if sep else None
 
     def resolve(self, urn: str) -> URNResolution:
         """
@@ -1304,8 +1969,19 @@ class ResolverRegistry:
 
         Automatically routes to appropriate resolver based on URN family.
         """
-        family = self.get_family(urn)
-        if not family:
+        cache = self._resolve_cache
+        if urn in cache:
+            cache.move_to_end(urn)
+            return cache[urn]
+
+        resolution = self._resolve_uncached(urn)
+        self._cache_put(urn, resolution)
+        return resolution
+
+    def _resolve_uncached(self, urn: str) -> URNResolution:
+        # Inlined get_family()
+        family, sep, _ = urn.partition(":")
+        if not sep or not family:
             return URNResolution(
                 urn=urn, family="unknown", error=f"Invalid URN format: {urn}"
             )
@@ -1320,9 +1996,42 @@ class ResolverRegistry:
 
         return resolver.resolve(urn)
 
+    def resolve_many(self, urns: List[str]) -> List[URNResolution]:
+        """
+        Resolve multiple URNs, preserving input order.
+
+        Memoized and duplicate URNs are answered from the cache; the rest
+        are grouped by family and handed to each resolver's resolve_many()
+        in one batch.
+        """
+        cache = self._resolve_cache
+        # family -> URNs to resolve (dict keys keep order and drop duplicates)
+        batches: Dict[str, Dict[str, None]] = {}
+        for urn in urns:
+            if urn in cache:
+                continue
+            family, sep, _ = urn.partition(":")
+            if sep and family in self._resolvers:
+                batches.setdefault(family, {})[urn] = None
+            else:
+                self.resolve(urn)
+
+        resolved: Dict[str, URNResolution] = {}
+        for family, pending in batches.items():
+            batch = list(pending)
+            for urn, resolution in zip(batch, self._resolvers[family].resolve_many(batch)):
+                resolved[urn] = resolution
+                self._cache_put(urn, resolution)
+
+        results = []
+        for urn in urns:
+            resolution = resolved.get(urn)
+            results.append(resolution if resolution is not None else self.resolve(urn))
+        return results
+
     def resolve_all(self, urns: List[str]) -> Dict[str, URNResolution]:
         """Resolve multiple URNs."""
-        return {urn: self.resolve(urn) for urn in urns}
+        return dict(zip(urns, self.resolve_many(urns)))
 
     def find_all_declarations(
         self, families: Optional[List[str]] = None
@@ -1336,15 +2045,43 @@ class ResolverRegistry:
         Returns:
             Dict mapping family to list of declarations.
         """
-        result = {}
         target_families = families or list(self._resolvers.keys())
-
-        for family in target_families:
-            resolver = self._resolvers.get(family)
-            if resolver:
-                result[family] = resolver.find_declarations()
-
-        return result
+        resolvers = [
+            (family, self._resolvers[family])
+            for family in target_families
+            if family in self._resolvers
+        ]
+        if not resolvers:
+            return {}
+
+        # Repo-wide code scans (components, tests) share one walk
+        snapshot = FilesystemSnapshot(self.repo_root, ComponentResolver._CODE_EXTENSIONS)
+
+        # Resolvers reading the same field selection (WMBT and acceptance)
+        # run one after the other, so the second is served from the shared
+        # _FieldCache instead of both parsing every file cold.
+        groups: Dict[object, List[Tuple[str, BaseResolver]]] = {}
+        for family, resolver in resolvers:
+            key = getattr(resolver, "_FIELDS", None) or family
+            groups.setdefault(key, []).append((family, resolver))
+
+        def scan(group: List[Tuple[str, BaseResolver]]) -> Dict[str, List[URNDeclaration]]:
+            return {
+                family: (
+                    resolver.find_declarations(snapshot)
+                    if _accepts_snapshot(type(resolver))
+                    else resolver.find_declarations()
+                )
+                for family, resolver in group
+            }
+
+        # Each group walks its own part of the repo; run the walks
+        # concurrently since they are dominated by blocking I/O.
+        with ThreadPoolExecutor(max_workers=min(8, len(groups))) as executor:
+            scanned: Dict[str, List[URNDeclaration]] = {}
+            for result in executor.map(scan, groups.values()):
+                scanned.update(result)
+        return {family: scanned[family] for family, _ in resolvers}
 
     @property
     def families(self) -> List[str]:
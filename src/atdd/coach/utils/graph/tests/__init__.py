@@ -0,0 +1 @@
+# Test module for URN graph utilities
@@ -0,0 +1,332 @@
+"""
+Tests for the resolver's caches, indexes and URN dispatch.
+
+Validates:
+- _FieldCache hit, miss, stale-stamp and corrupt-file handling
+- The on-disk field cache is opt-in (ATDD_RESOLVER_CACHE=1) and repo-local
+- Shared and per-resolver directory listings are revalidated when a
+  directory changes
+- ContractResolver index lookups by $id and by path
+- MigrationResolver declarations in a stable (sorted) order
+- ResolverRegistry family dispatch, memoization and batch ordering
+- ResolverRegistry.invalidate() drops resolver indexes built before a change
+- Custom resolvers whose family is only known after BaseResolver.__init__
+- find_all_declarations parses files shared by resolvers only once and
+  still calls resolvers whose find_declarations() takes no snapshot
+"""
+
+import json
+import os
+import time
+
+import pytest
+
+from atdd.coach.utils.graph import resolver as resolver_module
+from atdd.coach.utils.graph.resolver import (
+    ContractResolver,
+    MigrationResolver,
+    ResolverRegistry,
+    WMBTResolver,
+    WagonResolver,
+    _ACC_URN_PATH,
+    _FieldCache,
+    _WMBT_FIELDS,
+    _field_cache,
+)
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Minimal ATDD repository with one wagon, one WMBT and one contract."""
+    wagon_dir = tmp_path / "plan" / "maintain_ux"
+    wagon_dir.mkdir(parents=True)
+    (wagon_dir / "_maintain_ux.yaml").write_text("wagon: maintain-ux\n")
+    (wagon_dir / "C004.yaml").write_text(
+        "urn: wmbt:maintain-ux:C004\n"
+        "acceptances:\n"
+        "  - identity:\n"
+        "      urn: acc:maintain-ux:C004-E2E-001\n"
+    )
+    contract_dir = tmp_path / "contracts" / "ux"
+    contract_dir.mkdir(parents=True)
+    (contract_dir / "foundations.schema.json").write_text(
+        json.dumps({"$id": "ux:foundations"})
+    )
+    (contract_dir / "colors.schema.json").write_text(json.dumps({"type": "object"}))
+    return tmp_path
+
+
+@pytest.fixture
+def wmbt_file(repo):
+    return repo / "plan" / "maintain_ux" / "C004.yaml"
+
+
+@pytest.fixture
+def extract_calls(monkeypatch):
+    """Count calls to _extract_yaml_fields while delegating to the real one."""
+    calls = []
+    real_extract = resolver_module._extract_yaml_fields
+
+    def counting_extract(path, wanted):
+        calls.append(path)
+        return real_extract(path, wanted)
+
+    monkeypatch.setattr(resolver_module, "_extract_yaml_fields", counting_extract)
+    return calls
+
+
+# ============================================================================
+# _FieldCache
+# ============================================================================
+
+
+def test_field_cache_miss_extracts_and_stores(repo, wmbt_file, extract_calls):
+    cache = _FieldCache(repo)
+
+    fields = cache.get(wmbt_file, _WMBT_FIELDS)
+
+    assert fields[("urn",)] == ["wmbt:maintain-ux:C004"]
+    assert fields[_ACC_URN_PATH] == ["acc:maintain-ux:C004-E2E-001"]
+    assert extract_calls == [wmbt_file]
+    assert cache.dirty
+
+
+def test_field_cache_hit_skips_extraction(repo, wmbt_file, extract_calls):
+    cache = _FieldCache(repo)
+    first = cache.get(wmbt_file, _WMBT_FIELDS)
+
+    second = cache.get(wmbt_file, _WMBT_FIELDS)
+
+    assert second == first
+    assert len(extract_calls) == 1
+
+
+def test_field_cache_stale_stamp_re_extracts(repo, wmbt_file, extract_calls):
+    cache = _FieldCache(repo)
+    cache.get(wmbt_file, _WMBT_FIELDS)
+
+    wmbt_file.write_text("urn: wmbt:maintain-ux:C005\n")
+    st = os.stat(wmbt_file)
+    os.utime(wmbt_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    fields = cache.get(wmbt_file, _WMBT_FIELDS)
+
+    assert fields[("urn",)] == ["wmbt:maintain-ux:C005"]
+    assert len(extract_calls) == 2
+
+
+def test_field_cache_is_memory_only_by_default(repo, wmbt_file):
+    cache = _FieldCache(repo)
+    cache.get(wmbt_file, _WMBT_FIELDS)
+
+    cache.save()
+
+    assert not (repo / ".atdd").exists()
+
+
+def test_field_cache_persists_under_repo_cache_dir(repo, wmbt_file, extract_calls):
+    cache = _FieldCache(repo, persistent=True)
+    cache.get(wmbt_file, _WMBT_FIELDS)
+    cache.save()
+
+    assert cache.path.parent == repo / ".atdd" / "cache"
+    assert (repo / ".atdd" / "cache" / ".gitignore").read_text().endswith("*\n")
+
+    reloaded = _FieldCache(repo, persistent=True)
+    fields = reloaded.get(wmbt_file, _WMBT_FIELDS)
+
+    assert fields[("urn",)] == ["wmbt:maintain-ux:C004"]
+    assert len(extract_calls) == 1
+    assert not reloaded.dirty
+
+
+@pytest.mark.parametrize("content", [
+    "{not json",
+    json.dumps({"version": -1, "entries": {"x": {}}}),
+    json.dumps({"version": 1, "entries": ["not", "a", "dict"]}),
+    json.dumps(["not", "a", "dict"]),
+])
+def test_field_cache_ignores_corrupt_file(repo, wmbt_file, content):
+    cache_path = repo / ".atdd" / "cache" / resolver_module.FIELD_CACHE_FILE
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_text(content)
+
+    cache = _FieldCache(repo, persistent=True)
+
+    assert cache.entries == {}
+    assert cache.get(wmbt_file, _WMBT_FIELDS)[("urn",)] == ["wmbt:maintain-ux:C004"]
+
+
+def test_field_cache_persistence_is_opt_in(repo, monkeypatch):
+    monkeypatch.setattr(resolver_module, "_field_caches", {})
+    monkeypatch.delenv("ATDD_RESOLVER_CACHE", raising=False)
+    assert not _field_cache(repo).persistent
+
+    monkeypatch.setattr(resolver_module.atexit, "register", lambda fn: fn)
+    monkeypatch.setenv("ATDD_RESOLVER_CACHE", "1")
+    assert _field_cache(repo).persistent
+
+
+# ============================================================================
+# Directory listings and indexes
+# ============================================================================
+
+
+def test_cached_rglob_revalidates_on_directory_change(repo, monkeypatch):
+    monkeypatch.setattr(resolver_module, "_listing_cache", {})
+    resolver = WagonResolver(repo)
+    wagon_dir = repo / "plan" / "maintain_ux"
+
+    first = resolver._cached_rglob(repo / "plan", ".yaml")
+    assert resolver._cached_rglob(repo / "plan", ".yaml") is first
+
+    (wagon_dir / "C005.yaml").write_text("urn: wmbt:maintain-ux:C005\n")
+    st = os.stat(wagon_dir)
+    os.utime(wagon_dir, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    second = resolver._cached_rglob(repo / "plan", ".yaml")
+
+    assert wagon_dir / "C005.yaml" in second
+    assert wagon_dir / "C005.yaml" not in first
+
+
+def test_dir_listing_sees_files_added_later(repo):
+    resolver = WMBTResolver(repo)
+    wagon_dir = repo / "plan" / "maintain_ux"
+    assert resolver.resolve("wmbt:maintain-ux:C005").is_broken
+
+    (wagon_dir / "C005.yaml").write_text("urn: wmbt:maintain-ux:C005\n")
+    st = os.stat(wagon_dir)
+    os.utime(wagon_dir, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert resolver.resolve("wmbt:maintain-ux:C005").is_resolved
+    assert not resolver._dir_has(wagon_dir, "C006.yaml")
+    assert not resolver._dir_has(repo / "missing", "C005.yaml")
+
+
+def test_contract_index_matches_id_and_path(repo):
+    resolver = ContractResolver(repo)
+
+    by_id = resolver.resolve("contract:ux:foundations")
+    by_path = resolver.resolve("contract:ux:colors")
+    missing = resolver.resolve("contract:ux:missing")
+
+    assert by_id.resolved_paths == [repo / "contracts" / "ux" / "foundations.schema.json"]
+    assert by_path.resolved_paths == [repo / "contracts" / "ux" / "colors.schema.json"]
+    assert missing.is_broken
+
+
+def test_migration_declarations_are_sorted(repo):
+    migrations_dir = repo / "supabase" / "migrations"
+    migrations_dir.mkdir(parents=True)
+    names = [f"2024010100000{i}_step_{i}.sql" for i in (3, 1, 2)]
+    for name in names + ["notes.sql"]:
+        (migrations_dir / name).write_text("-- migration\n")
+
+    declarations = MigrationResolver(repo).find_declarations()
+
+    assert [d.source_path.name for d in declarations] == sorted(names)
+
+
+# ============================================================================
+# ResolverRegistry dispatch
+# ============================================================================
+
+
+def test_registry_dispatch_errors(repo):
+    registry = ResolverRegistry(repo)
+
+    assert registry.resolve("no-colon").family == "unknown"
+    assert registry.resolve("bogus:x").error == "No resolver registered for family: bogus"
+
+
+def test_registry_accepts_resolver_with_family_set_after_init(repo):
+    class AliasWagonResolver(WagonResolver):
+        def __init__(self, repo_root, alias):
+            super().__init__(repo_root)
+            self.alias = alias
+
+        @property
+        def family(self) -> str:
+            return self.alias
+
+    registry = ResolverRegistry(repo)
+    registry.register(AliasWagonResolver(repo, "wagon"))
+
+    assert registry.resolve("wagon:maintain-ux").is_resolved
+
+
+def test_registry_resolve_many_preserves_order_and_memoizes(repo):
+    registry = ResolverRegistry(repo)
+    urns = [
+        "wmbt:maintain-ux:C004",
+        "contract:ux:foundations",
+        "bogus:x",
+        "wmbt:maintain-ux:C004",
+    ]
+
+    results = registry.resolve_many(urns)
+
+    assert [r.urn for r in results] == urns
+    assert results[0] is results[3]
+    assert results[0].is_resolved and results[1].is_resolved
+    assert registry.resolve("contract:ux:foundations") is results[1]
+
+    registry.invalidate()
+    assert registry.resolve("contract:ux:foundations") is not results[1]
+
+
+def test_registry_invalidate_sees_files_created_after_a_miss(repo):
+    registry = ResolverRegistry(repo)
+    urns = ["wagon:new-wagon", "contract:ux:buttons", "table:orders"]
+    assert not any(r.is_resolved for r in registry.resolve_many(urns))
+
+    wagon_dir = repo / "plan" / "new_wagon"
+    wagon_dir.mkdir()
+    (wagon_dir / "_new_wagon.yaml").write_text("wagon: new-wagon\n")
+    (repo / "contracts" / "ux" / "buttons.schema.json").write_text("{}")
+    migrations_dir = repo / "supabase" / "migrations"
+    migrations_dir.mkdir(parents=True)
+    (migrations_dir / "001_orders.sql").write_text("create table orders (id int);\n")
+    registry.invalidate()
+
+    assert all(r.is_resolved for r in registry.resolve_many(urns))
+
+
+def test_find_all_declarations_parses_shared_wmbt_files_once(
+    repo, wmbt_file, extract_calls, monkeypatch
+):
+    monkeypatch.setattr(resolver_module, "_field_caches", {})
+    monkeypatch.delenv("ATDD_RESOLVER_CACHE", raising=False)
+    counting_extract = resolver_module._extract_yaml_fields
+
+    def slow_extract(path, wanted):
+        # Long enough for a concurrent resolver to miss the cache too
+        time.sleep(0.05)
+        return counting_extract(path, wanted)
+
+    monkeypatch.setattr(resolver_module, "_extract_yaml_fields", slow_extract)
+    registry = ResolverRegistry(repo)
+
+    declarations = registry.find_all_declarations(["acc", "wmbt"])
+
+    assert list(declarations) == ["acc", "wmbt"]
+    assert [d.urn for d in declarations["wmbt"]] == ["wmbt:maintain-ux:C004"]
+    assert [d.urn for d in declarations["acc"]] == ["acc:maintain-ux:C004-E2E-001"]
+    assert extract_calls.count(wmbt_file) == 1
+
+
+def test_find_all_declarations_supports_resolvers_without_snapshot(repo):
+    class LegacyWagonResolver(WagonResolver):
+        def find_declarations(self):
+            return super().find_declarations()
+
+    registry = ResolverRegistry(repo)
+    registry.register(LegacyWagonResolver(repo))
+
+    declarations = registry.find_all_declarations(["wagon"])
+
+    assert [d.urn for d in declarations["wagon"]] == ["wagon:maintain-ux"]
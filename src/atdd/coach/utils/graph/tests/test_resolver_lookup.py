@@ -0,0 +1,58 @@
+"""
+Tests for resolver file lookups that must match the original traversal.
+
+Validates:
+- Component lookup searches every directory under a search path, including
+  names pruned from repo-wide scans (build/, env/, ...)
+- Component matches are grouped by extension (.py, .dart, .ts, .tsx)
+- Table lookup matches exact CREATE TABLE names, ignoring schema qualifiers
+"""
+
+from atdd.coach.utils.graph.resolver import ComponentResolver, TableResolver
+
+
+def test_component_lookup_does_not_prune_build_dirs(tmp_path):
+    domain_dir = tmp_path / "python" / "user_mgmt" / "auth" / "domain"
+    for sub in ("build", "env", "coverage"):
+        (domain_dir / sub).mkdir(parents=True)
+        (domain_dir / sub / "login_form.py").write_text("# component\n")
+
+    resolution = ComponentResolver(tmp_path).resolve(
+        "component:user-mgmt:auth:LoginForm:backend:domain"
+    )
+
+    assert sorted(p.parent.name for p in resolution.resolved_paths) == [
+        "build", "coverage", "env",
+    ]
+
+
+def test_component_lookup_groups_matches_by_extension(tmp_path):
+    domain_dir = tmp_path / "src" / "user_mgmt" / "auth" / "domain"
+    (domain_dir / "nested").mkdir(parents=True)
+    for name in ("login_form.tsx", "nested/login_form.py", "login_form.ts"):
+        (domain_dir / name).write_text("// component\n")
+
+    resolution = ComponentResolver(tmp_path).resolve(
+        "component:user-mgmt:auth:LoginForm:frontend:domain"
+    )
+
+    assert [p.suffix for p in resolution.resolved_paths] == [".py", ".ts", ".tsx"]
+
+
+def test_table_lookup_matches_schema_qualified_create_table(tmp_path):
+    migrations_dir = tmp_path / "supabase" / "migrations"
+    migrations_dir.mkdir(parents=True)
+    (migrations_dir / "001_init.sql").write_text(
+        'CREATE TABLE IF NOT EXISTS public."Users" (id uuid primary key);\n'
+    )
+    (migrations_dir / "002_orders.sql").write_text(
+        "create table orders (user_id uuid references public.users(id));\n"
+    )
+    resolver = TableResolver(tmp_path)
+
+    resolution = resolver.resolve("table:users")
+
+    assert resolution.resolved_paths == [migrations_dir / "001_init.sql"]
+    assert sorted(d.urn for d in resolver.find_declarations()) == [
+        "table:Users", "table:orders",
+    ]
@@ -0,0 +1,133 @@
+"""
+Tests for URNBuilder parsing and validation and the urn CLI.
+
+Validates:
+- parse_urn routes each URN type to its parser
+- parse_urns matches parse_urn item by item
+- Identifier normalization
+- validate_urn rejects other families before matching the pattern
+- classify_urn agrees with validate_urn
+- Memoized builders reject invalid argument types on warm caches too
+- The CLI fast path prints the same output as the argparse path
+"""
+
+import json
+import sys
+
+import pytest
+
+from atdd.coach.utils.graph import urn as urn_module
+from atdd.coach.utils.graph.urn import URNBuilder
+
+
+# ============================================================================
+# Parsing
+# ============================================================================
+
+
+@pytest.mark.parametrize("urn, expected", [
+    ("wagon:maintain-ux", {"type": "wagon", "wagon_id": "maintain-ux"}),
+    ("feature:maintain-ux:auth", {
+        "type": "feature", "wagon_id": "maintain-ux", "feature_id": "auth",
+    }),
+    ("wmbt:maintain-ux:C004", {
+        "type": "wmbt", "wagon_id": "maintain-ux", "sequence": "C004",
+    }),
+    ("acc:maintain-ux:C004-E2E-019", {
+        "type": "acceptance", "wagon_id": "maintain-ux", "wmbt_id": "C004",
+        "harness": "E2E", "sequence": "019",
+    }),
+    ("test:a:b:M002-UNIT-003-slug", {
+        "type": "test", "format": "acceptance", "wagon_id": "a", "feature_id": "b",
+        "wmbt_id": "M002", "harness": "UNIT", "sequence": "003", "slug": "slug",
+    }),
+])
+def test_parse_urn_dispatches_by_type(urn, expected):
+    assert URNBuilder.parse_urn(urn) == expected
+
+
+@pytest.mark.parametrize("urn", ["nope", "Wagon:x", "table:users"])
+def test_parse_urn_unknown_type(urn):
+    with pytest.raises(ValueError, match="Unknown URN type"):
+        URNBuilder.parse_urn(urn)
+
+
+def test_parse_urns_matches_parse_urn():
+    urns = ["wagon:a", "feature:a:b", "wmbt:a:E001", "acc:a:C004-E2E-019"]
+
+    assert URNBuilder.parse_urns(urns) == [URNBuilder.parse_urn(u) for u in urns]
+
+
+# ============================================================================
+# Identifier normalization
+# ============================================================================
+
+
+@pytest.mark.parametrize("identifier, expected", [
+    ("Foo_Bar  baz", "foo-bar-baz"),
+    ("--a--b--", "a-b"),
+    ("A__B", "a-b"),
+    ("x", "x"),
+])
+def test_normalize_id(identifier, expected):
+    assert URNBuilder._normalize_id(identifier) == expected
+
+
+# ============================================================================
+# Validation
+# ============================================================================
+
+
+def test_validate_urn_checks_family_prefix():
+    assert URNBuilder.validate_urn("wagon:maintain-ux", "wagon")
+    assert not URNBuilder.validate_urn("feature:maintain-ux:auth", "wagon")
+    with pytest.raises(ValueError, match="Unknown entity type"):
+        URNBuilder.validate_urn("wagon:a", "nope")
+
+
+@pytest.mark.parametrize("urn", [
+    "wagon:b", "wagon:b\n", "feature:a:b", "wmbt:a:E001", "acc:a:C004-E2E-019",
+    "wagon:B", "feature:a", "nope",
+])
+def test_classify_urn_agrees_with_validate_urn(urn):
+    matching = [t for t in URNBuilder.PATTERNS if URNBuilder.validate_urn(urn, t)]
+
+    assert URNBuilder.classify_urn(urn) == (matching[0] if matching else None)
+
+
+# ============================================================================
+# Builders
+# ============================================================================
+
+
+def test_memoized_acceptance_rejects_float_sequence_after_int():
+    assert URNBuilder.acceptance("w", "D001", "UNIT", 1) == "acc:w:D001-UNIT-001"
+
+    # 1.0 == 1 and hashes alike; it must not hit the entry cached for 1
+    with pytest.raises(TypeError):
+        URNBuilder.acceptance("w", "D001", "UNIT", 1.0)
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+
+@pytest.mark.parametrize("argv", [
+    ["wagon", "Manage_Users"],
+    ["feature", "manage-users", "auth"],
+    ["wmbt", "manage-users", "E001"],
+    ["parse", "feature:manage-users:auth"],
+])
+def test_cli_fast_path_matches_argparse(argv, monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["urn", *argv])
+    assert urn_module.main() == 0
+    fast_output = capsys.readouterr().out
+
+    # A flag-free call with an extra "--" disables the fast path
+    monkeypatch.setattr(sys, "argv", ["urn", argv[0], "--", *argv[1:]])
+    assert urn_module.main() == 0
+    assert capsys.readouterr().out == fast_output
+
+    if argv[0] == "parse":
+        assert json.loads(fast_output)["type"] == "feature"
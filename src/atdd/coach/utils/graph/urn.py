@@ -60,17 +60,99 @@ Usage:
     test_urn = URNBuilder.test("manage-users", "tc-login-success", feature_id="authenticate-user")
 """
 
+import functools
 import re
 import sys
-from pathlib import Path
-from typing import Optional, Literal
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Iterable, Optional, Literal
 
 # No logger needed - removed _bootstrap dependency
 
+# Compiled once; builders run these in tight loops during graph building
+_TRAIN_ID_RE = re.compile(r'^\d{4}-[a-z0-9][a-z0-9-]*$')
+_WMBT_KEY_RE = re.compile(r'^([DLPCEMYRK])(\d{3})$')
+_HYPHEN_RUN_RE = re.compile(r'-+')
+_ID_SEPARATOR_TABLE = str.maketrans('_ ', '--')
+
+# Kebab-case ids ([a-z][a-z0-9-]*) are checked without the regex engine:
+# deleting every allowed character must leave nothing.
+_KEBAB_ID_DELETE = str.maketrans('', '', 'abcdefghijklmnopqrstuvwxyz0123456789-')
+
+
+def _is_kebab_id(identifier: str) -> bool:
+    """Return True if identifier matches ^[a-z][a-z0-9-]*$."""
+    return (
+        bool(identifier)
+        and 'a' <= identifier[0] <= 'z'
+        and not identifier.translate(_KEBAB_ID_DELETE)
+    )
+
+
+_STEP_CODE_SET = frozenset('DLPCEMYRK')
+
+# Component names are [a-zA-Z0-9.]+; checked the same way as kebab ids
+_COMPONENT_NAME_DELETE = str.maketrans(
+    '', '', 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.'
+)
+_COMPONENT_SIDES = frozenset(('frontend', 'backend'))
+
+
+def _is_wmbt_id(candidate: str) -> bool:
+    """Return True if candidate matches [DLPCEMYRK][0-9]{3} exactly."""
+    digits = candidate[1:]
+    return (
+        len(candidate) == 4
+        and candidate[0] in _STEP_CODE_SET
+        and digits.isascii()
+        and digits.isdigit()
+    )
+
+
+def _is_test_wmbt_id(candidate: str) -> bool:
+    """Return True if candidate is an uppercase ASCII letter plus 3 digits."""
+    return (
+        len(candidate) == 4
+        and 'A' <= candidate[0] <= 'Z'
+        and candidate[1:].isdecimal()
+    )
+
+
+class _LazyPatternDict:
+    """
+    Compile URN patterns on first use.
+
+    Most runs only validate a few families, so compiling all of PATTERNS
+    at import is wasted work. Concurrent first uses may compile the same
+    pattern twice; both results are equivalent, so no lock is needed.
+    """
+
+    def __init__(self, raw):
+        self._raw = raw
+        self._cache = {}
+
+    def get(self, entity_type: str):
+        """Return the compiled pattern for entity_type, or None if unknown."""
+        compiled = self._cache.get(entity_type)
+        if compiled is None:
+            raw = self._raw.get(entity_type)
+            if raw is None:
+                return None
+            compiled = self._cache[entity_type] = re.compile(raw)
+        return compiled
+
+
 class URNBuilder:
-    """Centralized URN builder for all entity types."""
+    """
+    Centralized URN builder for all entity types.
+
+    The identity builders (wagon, feature, wmbt, acceptance, component) are
+    pure functions of their arguments and are memoized; graph building asks
+    for the same URNs many times over. The caches are typed, so a call
+    with 1.0 never reuses the entry cached for 1 and still fails validation.
+    """
 
-    STEP_LEGEND = {
+    STEP_LEGEND = MappingProxyType({
         "D": "define",
         "L": "locate",
         "P": "prepare",
@@ -80,13 +162,20 @@ class URNBuilder:
         "Y": "modify",
         "R": "resolve",
         "K": "conclude",
-    }
+    })
     STEP_NAMES = STEP_LEGEND
     STEP_CODE_LEGEND = STEP_LEGEND
     STEP_NAME_TO_CODE = {name: code for code, name in STEP_LEGEND.items()}
+    # Codes in either case plus lower/upper step names, for _normalize_step()
+    _STEP_ANY = {
+        **{code: code for code in STEP_LEGEND},
+        **{code.lower(): code for code in STEP_LEGEND},
+        **STEP_NAME_TO_CODE,
+        **{name.upper(): code for name, code in STEP_NAME_TO_CODE.items()},
+    }
 
     # Harness code mapping (authoritative)
-    HARNESS_CODES = {
+    HARNESS_CODES = MappingProxyType({
         'unit': 'UNIT',
         'http': 'HTTP',
         'event': 'EVENT',
@@ -108,19 +197,29 @@ class URNBuilder:
         'edge_function': 'EDGE',
         'realtime': 'REALTIME',
         'storage': 'STORAGE'
+    })
+    _VALID_HARNESSES = frozenset(HARNESS_CODES.values())
+    _HARNESS_ERR_LIST = ', '.join(sorted(_VALID_HARNESSES))
+    # Canonical code for the usual spellings; anything else goes through upper()
+    _HARNESS_FROM_ANY = {
+        key: code for code in _VALID_HARNESSES for key in (code, code.lower())
     }
 
-    _MANIFEST_STATE = {}
+    # next_wmbt_id() counters per manifest, keyed by id(manifest). Each entry
+    # holds the manifest itself so a recycled id() can't pick up stale
+    # counters; the oldest entries are evicted past _MANIFEST_STATE_MAX.
+    _MANIFEST_STATE: "OrderedDict[int, dict]" = OrderedDict()
+    _MANIFEST_STATE_MAX = 256
 
     # Pattern validators
-    PATTERNS = {
+    PATTERNS = MappingProxyType({
         # Identities
         'wagon': r'^wagon:[a-z][a-z0-9-]*$',
         'feature': r'^feature:[a-z][a-z0-9-]*:[a-z][a-z0-9-]*$',
         'component': r'^component:[a-z][a-z0-9-]*:[a-z][a-z0-9-]*:[a-zA-Z0-9.]+:(frontend|backend|fe|be):(presentation|application|domain|integration|assembly)$',
 
         # Artifacts (colon hierarchy with optional dot variant)
-        'plan': r'^plan:[a-z0-9]+(-[a-z0-9]+)*(:[a-z0-9]+(-[a-z0-9]+)*)*(\.[a-z0-9-]+)?$',
+        'plan': r'^plan:[a-z0-9]+(?:-[a-z0-9]+)*(?::[a-z0-9]+(?:-[a-z0-9]+)*)*(?:\.[a-z0-9-]+)?$',
         'test': (
             r'^test:('
             # V3 acceptance: test:{wagon}:{feature}:{WMBT_ID}-{HARNESS}-{NNN}-{slug}
@@ -133,8 +232,8 @@ class URNBuilder:
             r'[a-z0-9]+(?:-[a-z0-9]+)*(?::[a-z0-9]+(?:-[a-z0-9]+)*)*(?:\.[a-z0-9-]+)?'
             r')$'
         ),
-        'contract': r'^contract:[a-z][a-z0-9-]*(:[a-z][a-z0-9-]+)+(\.[a-z][a-z0-9-]+)?$',
-        'telemetry': r'^telemetry:[a-z][a-z0-9-]*(:[a-z][a-z0-9-]+)*(\.[a-z][a-z0-9-]+)?$',
+        'contract': r'^contract:[a-z][a-z0-9-]*(?::[a-z][a-z0-9-]+)+(?:\.[a-z][a-z0-9-]+)?$',
+        'telemetry': r'^telemetry:[a-z][a-z0-9-]*(?::[a-z][a-z0-9-]+)*(?:\.[a-z][a-z0-9-]+)?$',
 
         # ATDD Specific
         'wmbt': r'^wmbt:[a-z][a-z0-9-]*:[DLPCEMYRK][0-9]{3}$',
@@ -149,17 +248,48 @@ class URNBuilder:
         # Release management
         'train': r'^train:\d{4}-[a-z0-9][a-z0-9-]*$',
         'migration': r'^migration:\d{14}_[a-z][a-z0-9_]*$',
-    }
+    })
+    _PATTERNS_COMPILED = _LazyPatternDict(PATTERNS)
+    # Literal "{type}:" prefix of each pattern, checked before the regex
+    _PATTERN_PREFIXES = MappingProxyType({
+        entity_type: pattern[1:pattern.index(':') + 1]
+        for entity_type, pattern in PATTERNS.items()
+    })
+    # Union of all PATTERNS, built on first classify_urn() call
+    _CLASSIFY_RE = None
 
     @classmethod
     def validate_urn(cls, urn: str, entity_type: str) -> bool:
         """Validate that a URN matches the expected pattern."""
-        pattern = cls.PATTERNS.get(entity_type)
-        if not pattern:
+        prefix = cls._PATTERN_PREFIXES.get(entity_type)
+        if prefix is None:
             raise ValueError(f"Unknown entity type: {entity_type}")
-        return bool(re.match(pattern, urn))
+        if not urn.startswith(prefix):
+            return False
+        return bool(cls._PATTERNS_COMPILED.get(entity_type).match(urn))
 
     @classmethod
+    def classify_urn(cls, urn: str) -> Optional[str]:
+        """
+        Return the entity type whose pattern matches the URN, or None.
+
+        Runs one combined match instead of calling validate_urn() once per
+        candidate type. Every pattern starts with a distinct prefix, so at
+        most one type can match.
+        """
+        if cls._CLASSIFY_RE is None:
+            # Move each pattern's ^...$ anchors onto the union; match() plus
+            # "$" accepts exactly what validate_urn() accepts (including a
+            # trailing newline)
+            cls._CLASSIFY_RE = re.compile('(?:' + '|'.join(
+                f'(?P<{entity_type}>{pattern[1:-1]})'
+                for entity_type, pattern in cls.PATTERNS.items()
+            ) + ')$')
+        match = cls._CLASSIFY_RE.match(urn)
+        return match.lastgroup if match else None
+
+    @classmethod
+    @functools.lru_cache(maxsize=4096, typed=True)
     def wagon(cls, wagon_id: str) -> str:
         """
         Build a wagon URN.
@@ -177,17 +307,21 @@ class URNBuilder:
         wagon_id = cls._normalize_id(wagon_id)
 
         # Validate format
-        if not re.match(r'^[a-z][a-z0-9-]*$', wagon_id):
+        if not _is_kebab_id(wagon_id):
             raise ValueError(f"Invalid wagon ID format: {wagon_id}. Must start with lowercase letter, contain only lowercase alphanumeric and hyphens.")
 
         urn = f"wagon:{wagon_id}"
 
-        if not cls.validate_urn(urn, 'wagon'):
-            raise ValueError(f"Generated invalid wagon URN: {urn}")
+        # Every part was validated above; re-check the whole URN only in
+        # debug runs (stripped under -O)
+        if __debug__:
+            if not cls.validate_urn(urn, 'wagon'):
+                raise ValueError(f"Generated invalid wagon URN: {urn}")
 
         return urn
 
     @classmethod
+    @functools.lru_cache(maxsize=4096, typed=True)
     def feature(cls, wagon_id: str, feature_id: str) -> str:
         """
         Build a feature URN.
@@ -207,19 +341,21 @@ class URNBuilder:
         feature_id = cls._normalize_id(feature_id)
 
         # Validate format
-        if not re.match(r'^[a-z][a-z0-9-]*$', wagon_id):
+        if not _is_kebab_id(wagon_id):
             raise ValueError(f"Invalid wagon ID for feature: {wagon_id}")
-        if not re.match(r'^[a-z][a-z0-9-]*$', feature_id):
+        if not _is_kebab_id(feature_id):
             raise ValueError(f"Invalid feature ID: {feature_id}")
 
         urn = f"feature:{wagon_id}:{feature_id}"
 
-        if not cls.validate_urn(urn, 'feature'):
-            raise ValueError(f"Generated invalid feature URN: {urn}")
+        if __debug__:
+            if not cls.validate_urn(urn, 'feature'):
+                raise ValueError(f"Generated invalid feature URN: {urn}")
 
         return urn
 
     @classmethod
+    @functools.lru_cache(maxsize=4096, typed=True)
     def wmbt(cls, wagon_id: str, sequence: str) -> str:
         """
         Build a WMBT URN.
@@ -240,13 +376,14 @@ class URNBuilder:
         step_coded_id = cls._normalize_wmbt_id(sequence)
 
         # Validate wagon ID format
-        if not re.match(r'^[a-z][a-z0-9-]*$', wagon_id):
+        if not _is_kebab_id(wagon_id):
             raise ValueError(f"Invalid wagon ID for WMBT: {wagon_id}")
 
         urn = f"wmbt:{wagon_id}:{step_coded_id}"
 
-        if not cls.validate_urn(urn, 'wmbt'):
-            raise ValueError(f"Generated invalid WMBT URN: {urn}")
+        if __debug__:
+            if not cls.validate_urn(urn, 'wmbt'):
+                raise ValueError(f"Generated invalid WMBT URN: {urn}")
 
         return urn
 
@@ -256,8 +393,7 @@ class URNBuilder:
         if not isinstance(wmbt_id, str):
             raise TypeError("wmbt_id must be a string")
 
-        match = re.fullmatch(r'^[DLPCEMYRK][0-9]{3}$', wmbt_id.strip())
-        if not match:
+        if not _is_wmbt_id(wmbt_id.strip()):
             raise ValueError(f"Invalid WMBT id format: {wmbt_id}")
 
         return cls.STEP_LEGEND[wmbt_id[0]]
@@ -271,10 +407,18 @@ class URNBuilder:
         step_code = cls._normalize_step(step)
         current_wagon = manifest.get('wagon')
 
-        state = cls._MANIFEST_STATE.get(id(manifest))
-        if state is None or state.get('wagon') != current_wagon:
-            state = {'wagon': current_wagon, 'counters': {}}
-            cls._MANIFEST_STATE[id(manifest)] = state
+        key = id(manifest)
+        state = cls._MANIFEST_STATE.get(key)
+        if (
+            state is None
+            or state['manifest'] is not manifest
+            or state['wagon'] != current_wagon
+        ):
+            state = {'manifest': manifest, 'wagon': current_wagon, 'counters': {}}
+            cls._MANIFEST_STATE[key] = state
+        cls._MANIFEST_STATE.move_to_end(key)
+        if len(cls._MANIFEST_STATE) > cls._MANIFEST_STATE_MAX:
+            cls._MANIFEST_STATE.popitem(last=False)
 
         counters = state['counters']
         current_counter = counters.get(step_code)
@@ -291,16 +435,16 @@ class URNBuilder:
                 if all(wagon_slug not in str(entry) and wagon_token not in str(entry) for entry in produce_entries):
                     existing = {}
 
-            pattern = re.compile(rf'^{step_code}(\d{{3}})$')
-            max_index = 0
-            for key in existing.keys():
-                if not isinstance(key, str):
-                    continue
-                match = pattern.match(key)
-                if match:
-                    max_index = max(max_index, int(match.group(1)))
-
-            current_counter = max_index
+            current_counter = max(
+                (
+                    int(match.group(2))
+                    for key in existing
+                    if isinstance(key, str)
+                    and (match := _WMBT_KEY_RE.match(key))
+                    and match.group(1) == step_code
+                ),
+                default=0,
+            )
 
         if current_counter >= 999:
             raise ValueError(f"No remaining ids for step {step}")
@@ -319,12 +463,8 @@ class URNBuilder:
         if not cleaned:
             raise ValueError("step cannot be empty")
 
-        upper = cleaned.upper()
-        if upper in cls.STEP_LEGEND:
-            return upper
-
-        lower = cleaned.lower()
-        code = cls.STEP_NAME_TO_CODE.get(lower)
+        # Mixed-case step names fall back to a lowercased name lookup
+        code = cls._STEP_ANY.get(cleaned) or cls.STEP_NAME_TO_CODE.get(cleaned.lower())
         if code:
             return code
 
@@ -334,7 +474,7 @@ class URNBuilder:
     def _normalize_wmbt_id(cls, wmbt_id) -> str:
         if isinstance(wmbt_id, str):
             candidate = wmbt_id.strip().upper()
-            if re.fullmatch(r'^[DLPCEMYRK][0-9]{3}$', candidate):
+            if _is_wmbt_id(candidate):
                 return candidate
             raise ValueError("WMBT id must match pattern [DLPCEMYRK][0-9]{3}")
 
@@ -354,10 +494,10 @@ class URNBuilder:
                 raise ValueError("WMBT sequence cannot be empty")
 
             upper = cleaned.upper()
-            if re.fullmatch(r'^[DLPCEMYRK][0-9]{3}$', upper):
+            if _is_wmbt_id(upper):
                 return upper
 
-            if re.fullmatch(r'^\d{1,3}$', cleaned):
+            if 1 <= len(cleaned) <= 3 and cleaned.isdecimal():
                 value = int(cleaned)
                 if value <= 0 or value > 999:
                     raise ValueError("WMBT sequence must be between 1 and 999")
@@ -367,7 +507,25 @@ class URNBuilder:
 
         raise TypeError("WMBT sequence must be an int or string")
 
+    @staticmethod
+    def _pad_seq(seq) -> str:
+        """Validate a 1-999 acceptance sequence (int or 1-3 digits) and zero-pad it."""
+        if isinstance(seq, int):
+            value = seq
+        elif isinstance(seq, str):
+            cleaned = seq.strip()
+            if not (1 <= len(cleaned) <= 3 and cleaned.isdecimal()):
+                raise ValueError("Sequence must be 1-3 digit number")
+            value = int(cleaned)
+        else:
+            raise TypeError("Sequence must be int or string")
+
+        if value <= 0 or value > 999:
+            raise ValueError("Sequence must be between 1 and 999")
+        return f"{value:03d}"
+
     @classmethod
+    @functools.lru_cache(maxsize=4096, typed=True)
     def acceptance(cls, wagon_id: str, wmbt_id: str, harness_code: str, seq, slug: Optional[str] = None) -> str:
         """
         Build an acceptance URN (refactored format).
@@ -396,29 +554,15 @@ class URNBuilder:
         wmbt_id = cls._normalize_wmbt_id(wmbt_id)
 
         # Validate harness code
-        harness_code = harness_code.upper()
-        valid_harnesses = set(cls.HARNESS_CODES.values())
-        if harness_code not in valid_harnesses:
+        harness_code = cls._HARNESS_FROM_ANY.get(harness_code) or harness_code.upper()
+        if harness_code not in cls._VALID_HARNESSES:
             raise ValueError(
                 f"Invalid harness code: {harness_code}. "
-                f"Must be one of: {', '.join(sorted(valid_harnesses))}"
+                f"Must be one of: {cls._HARNESS_ERR_LIST}"
             )
 
         # Normalize and pad sequence
-        if isinstance(seq, int):
-            if seq <= 0 or seq > 999:
-                raise ValueError("Sequence must be between 1 and 999")
-            seq_str = f"{seq:03d}"
-        elif isinstance(seq, str):
-            seq_clean = seq.strip()
-            if not re.match(r'^\d{1,3}$', seq_clean):
-                raise ValueError("Sequence must be 1-3 digit number")
-            seq_int = int(seq_clean)
-            if seq_int <= 0 or seq_int > 999:
-                raise ValueError("Sequence must be between 1 and 999")
-            seq_str = f"{seq_int:03d}"
-        else:
-            raise TypeError("Sequence must be int or string")
+        seq_str = cls._pad_seq(seq)
 
         # Build URN
         urn = f"acc:{wagon_id}:{wmbt_id}-{harness_code}-{seq_str}"
@@ -435,11 +579,12 @@ class URNBuilder:
         return urn
 
     # Valid layers for component URNs
-    COMPONENT_LAYERS = [
+    COMPONENT_LAYERS = (
         'presentation', 'application', 'domain', 'integration', 'assembly',
-    ]
+    )
 
     @classmethod
+    @functools.lru_cache(maxsize=4096, typed=True)
     def component(cls,
                   wagon_id: str,
                   feature_id: str,
@@ -477,13 +622,13 @@ class URNBuilder:
         feature_id = cls._normalize_id(feature_id)
 
         # Validate formats
-        if not re.match(r'^[a-z][a-z0-9-]*$', wagon_id):
+        if not _is_kebab_id(wagon_id):
             raise ValueError(f"Invalid wagon ID for component: {wagon_id}")
-        if not re.match(r'^[a-z][a-z0-9-]*$', feature_id):
+        if not _is_kebab_id(feature_id):
             raise ValueError(f"Invalid feature ID for component: {feature_id}")
-        if not re.match(r'^[a-zA-Z0-9.]+$', component_name):
+        if not component_name or component_name.translate(_COMPONENT_NAME_DELETE):
             raise ValueError(f"Invalid component name: {component_name}. Must be alphanumeric (dots allowed).")
-        if side not in ['frontend', 'backend']:
+        if side not in _COMPONENT_SIDES:
             raise ValueError(f"Invalid side: {side}. Must be 'frontend' or 'backend'.")
         if layer not in cls.COMPONENT_LAYERS:
             raise ValueError(f"Invalid layer: {layer}. Must be one of: {', '.join(cls.COMPONENT_LAYERS)}.")
@@ -494,8 +639,9 @@ class URNBuilder:
 
         urn = f"component:{wagon_id}:{feature_id}:{component_name}:{side}:{layer}"
 
-        if not cls.validate_urn(urn, 'component'):
-            raise ValueError(f"Generated invalid component URN: {urn}")
+        if __debug__:
+            if not cls.validate_urn(urn, 'component'):
+                raise ValueError(f"Generated invalid component URN: {urn}")
 
         return urn
 
@@ -533,20 +679,21 @@ class URNBuilder:
         # Normalize IDs
         wagon_id = cls._normalize_id(wagon_id)
 
-        # Build URN progressively
-        urn = f"plan:{wagon_id}"
+        # Collect dot-separated parts, then join once
+        parts = [wagon_id]
 
         if feature_id:
-            feature_id = cls._normalize_id(feature_id)
-            urn += f".{feature_id}"
+            parts.append(cls._normalize_id(feature_id))
 
             if component_name:
                 if not side or not layer:
                     raise ValueError("Component requires both side and layer")
-                urn += f".{component_name}.{side}.{layer}"
+                parts.extend((component_name, side, layer))
         elif component_name:
             raise ValueError("Cannot specify component without feature")
 
+        urn = "plan:" + ".".join(parts)
+
         if not cls.validate_urn(urn, 'plan'):
             raise ValueError(f"Generated invalid plan URN: {urn}")
 
@@ -583,9 +730,7 @@ class URNBuilder:
         segments = [cls._normalize_id(s) for s in hierarchy]
 
         # Build URN with colon hierarchy
-        urn = f"contract:{theme}"
-        for segment in segments:
-            urn += f":{segment}"
+        urn = "contract:" + ":".join((theme, *segments))
 
         # Add optional dot variant
         if variant:
@@ -628,9 +773,7 @@ class URNBuilder:
         segments = [cls._normalize_id(s) for s in hierarchy]
 
         # Build URN with colon hierarchy
-        urn = f"telemetry:{theme}"
-        for segment in segments:
-            urn += f":{segment}"
+        urn = "telemetry:" + ":".join((theme, *segments))
 
         # Add optional dot variant
         if variant:
@@ -679,19 +822,19 @@ class URNBuilder:
         wagon_id = cls._normalize_id(wagon_id)
         test_case = cls._normalize_id(test_case)
 
-        # Build URN progressively
-        urn = f"test:{wagon_id}"
+        # Collect dot-separated parts, then join once
+        parts = [wagon_id]
 
         if feature_id:
-            feature_id = cls._normalize_id(feature_id)
-            urn += f".{feature_id}"
+            parts.append(cls._normalize_id(feature_id))
 
             if component_name:
                 if not side or not layer:
                     raise ValueError("Component requires both side and layer")
-                urn += f".{component_name}.{side}.{layer}"
+                parts.extend((component_name, side, layer))
 
-        urn += f".{test_case}"
+        parts.append(test_case)
+        urn = "test:" + ".".join(parts)
 
         if not cls.validate_urn(urn, 'test'):
             raise ValueError(f"Generated invalid test URN: {urn}")
@@ -725,25 +868,25 @@ class URNBuilder:
                                        "M002", "UNIT", "003", "trace-spans-created")
             -> "test:authenticate-identity:verify-session:M002-UNIT-003-trace-spans-created"
         """
+        # Fail fast on a missing slug (or one that normalizes to nothing)
+        slug = cls._normalize_id(slug) if slug else ""
+        if not slug:
+            raise ValueError("slug is required for test URNs")
+
         wagon_id = cls._normalize_id(wagon_id)
         feature_id = cls._normalize_id(feature_id)
         wmbt_id = cls._normalize_wmbt_id(wmbt_id)
-        harness = harness.upper()
-        slug = cls._normalize_id(slug)
+        harness = cls._HARNESS_FROM_ANY.get(harness) or harness.upper()
 
-        valid_harnesses = set(cls.HARNESS_CODES.values())
-        if harness not in valid_harnesses:
-            raise ValueError(f"Invalid harness: {harness}. Must be one of: {', '.join(sorted(valid_harnesses))}")
+        if harness not in cls._VALID_HARNESSES:
+            raise ValueError(f"Invalid harness: {harness}. Must be one of: {cls._HARNESS_ERR_LIST}")
 
         if isinstance(seq, int):
             seq = f"{seq:03d}"
         seq = seq.strip().zfill(3)
-        if not re.match(r'^\d{3}$', seq):
+        if not (len(seq) == 3 and seq.isdecimal()):
             raise ValueError(f"Invalid sequence: {seq}. Must be 3 digits.")
 
-        if not slug:
-            raise ValueError("slug is required for test URNs")
-
         urn = f"test:{wagon_id}:{feature_id}:{wmbt_id}-{harness}-{seq}-{slug}"
 
         if not cls.validate_urn(urn, 'test'):
@@ -773,25 +916,25 @@ class URNBuilder:
             URNBuilder.test_journey("0025-onboarding", "E2E", "001", "full-login-flow")
             -> "test:train:0025-onboarding:E2E-001-full-login-flow"
         """
-        harness = harness.upper()
-        slug = cls._normalize_id(slug)
+        # Fail fast on a missing slug (or one that normalizes to nothing)
+        slug = cls._normalize_id(slug) if slug else ""
+        if not slug:
+            raise ValueError("slug is required for test URNs")
 
-        if not re.match(r'^\d{4}-[a-z0-9][a-z0-9-]*$', train_id):
+        harness = cls._HARNESS_FROM_ANY.get(harness) or harness.upper()
+
+        if not _TRAIN_ID_RE.match(train_id):
             raise ValueError(f"Invalid train ID: {train_id}. Must match NNNN-kebab-case.")
 
-        valid_harnesses = set(cls.HARNESS_CODES.values())
-        if harness not in valid_harnesses:
-            raise ValueError(f"Invalid harness: {harness}. Must be one of: {', '.join(sorted(valid_harnesses))}")
+        if harness not in cls._VALID_HARNESSES:
+            raise ValueError(f"Invalid harness: {harness}. Must be one of: {cls._HARNESS_ERR_LIST}")
 
         if isinstance(seq, int):
             seq = f"{seq:03d}"
         seq = seq.strip().zfill(3)
-        if not re.match(r'^\d{3}$', seq):
+        if not (len(seq) == 3 and seq.isdecimal()):
             raise ValueError(f"Invalid sequence: {seq}. Must be 3 digits.")
 
-        if not slug:
-            raise ValueError("slug is required for test URNs")
-
         urn = f"test:train:{train_id}:{harness}-{seq}-{slug}"
 
         if not cls.validate_urn(urn, 'test'):
@@ -819,138 +962,218 @@ class URNBuilder:
                 'acceptance_id': 'AC-EXEC-201'
             }
         """
-        # Determine the type
-        if urn.startswith('wagon:'):
-            return {
-                'type': 'wagon',
-                'wagon_id': urn.replace('wagon:', '')
-            }
-        elif urn.startswith('feature:'):
-            parts = urn.replace('feature:', '').split(':')
-            return {
-                'type': 'feature',
-                'wagon_id': parts[0],
-                'feature_id': parts[1] if len(parts) > 1 else None
-            }
-        elif urn.startswith('wmbt:'):
-            parts = urn.replace('wmbt:', '').split(':')
-            return {
-                'type': 'wmbt',
-                'wagon_id': parts[0],
-                'sequence': parts[1] if len(parts) > 1 else None
-            }
-        elif urn.startswith('acc:'):
-            main_part = urn.replace('acc:', '')
-            parts = main_part.split(':')
-            # Format: wagon_id:wmbt_id-harness-seq[-slug]
-            result = {
-                'type': 'acceptance',
-                'wagon_id': parts[0] if len(parts) > 0 else None,
-            }
-
-            # Parse facets: wmbt_id-harness-seq[-slug]
-            if len(parts) > 1:
-                facets = parts[1].split('-')
-                if len(facets) >= 3:
-                    result['wmbt_id'] = facets[0]  # e.g., C004
-                    result['harness'] = facets[1]  # e.g., E2E
-                    result['sequence'] = facets[2]  # e.g., 019
-                    # Optional slug (remaining parts joined with hyphens)
-                    if len(facets) > 3:
-                        result['slug'] = '-'.join(facets[3:])
-
-            return result
-        elif urn.startswith('test:'):
-            main_part = urn[5:]  # strip 'test:'
-
-            # V3 journey format: test:train:{train_id}:{HARNESS}-{NNN}-{slug}
-            if main_part.startswith('train:'):
-                train_part = main_part[6:]  # strip 'train:'
-                colon_idx = train_part.find(':')
-                if colon_idx > 0:
-                    train_id = train_part[:colon_idx]
-                    tail = train_part[colon_idx + 1:]
-                    # Parse: {HARNESS}-{NNN}-{slug}
-                    segments = tail.split('-', 2)
-                    return {
-                        'type': 'test',
-                        'format': 'journey',
-                        'train_id': train_id,
-                        'harness': segments[0] if len(segments) > 0 else None,
-                        'sequence': segments[1] if len(segments) > 1 else None,
-                        'slug': segments[2] if len(segments) > 2 else None,
-                    }
-                return {'type': 'test', 'format': 'journey', 'train_id': train_part}
-
-            # V3 acceptance format: test:{wagon}:{feature}:{WMBT_ID}-{HARNESS}-{NNN}-{slug}
-            colon_parts = main_part.split(':')
-            if len(colon_parts) == 3:
-                wagon_id, feature_id, tail = colon_parts
-                # Parse tail: {WMBT_ID}-{HARNESS}-{NNN}-{slug}
-                # First 3 dash-segments = WMBT_ID, HARNESS, NNN; rest = slug
-                segments = tail.split('-', 3)
-                if len(segments) >= 3 and re.match(r'^[A-Z]\d{3}$', segments[0]):
-                    return {
-                        'type': 'test',
-                        'format': 'acceptance',
-                        'wagon_id': wagon_id,
-                        'feature_id': feature_id,
-                        'wmbt_id': segments[0],
-                        'harness': segments[1],
-                        'sequence': segments[2],
-                        'slug': segments[3] if len(segments) > 3 else None,
-                    }
-
-            # Legacy dot format: test:wagon.feature.tc-name
-            parts = main_part.split('.')
-            test_case = parts[-1] if parts else None
-            result = {
-                'type': 'test',
-                'format': 'legacy',
-                'wagon_id': parts[0] if len(parts) > 0 else None,
-                'test_case': test_case
-            }
-            if len(parts) > 2:
-                result['feature_id'] = parts[1]
-            if len(parts) > 5:
-                result['component_name'] = parts[2]
-                result['side'] = parts[3]
-                result['layer'] = parts[4]
-            return result
-        elif urn.startswith('component:'):
-            parts = urn.replace('component:', '').split(':')
-            return {
-                'type': 'component',
-                'wagon_id': parts[0] if len(parts) > 0 else None,
-                'feature_id': parts[1] if len(parts) > 1 else None,
-                'component_name': parts[2] if len(parts) > 2 else None,
-                'side': parts[3] if len(parts) > 3 else None,
-                'layer': parts[4] if len(parts) > 4 else None
-            }
-        else:
+        # Dispatch on the text before the first ':'; parsers get the rest
+        head, sep, rest = urn.partition(':')
+        parser = _PARSERS.get(head) if sep else None
+        if parser is None:
             raise ValueError(f"Unknown URN type: {urn}")
+        return parser(rest)
+
+    @classmethod
+    def parse_urns(cls, urns: Iterable[str]) -> list[dict]:
+        """
+        Parse many URNs in one call.
+
+        Equivalent to [parse_urn(u) for u in urns], with the dispatch table
+        bound once for the whole batch.
+
+        Raises:
+            ValueError: On the first URN with an unknown type
+        """
+        parsers = _PARSERS
+        results = []
+        append = results.append
+        for urn in urns:
+            head, sep, rest = urn.partition(':')
+            parser = parsers.get(head) if sep else None
+            if parser is None:
+                raise ValueError(f"Unknown URN type: {urn}")
+            append(parser(rest))
+        return results
 
     @staticmethod
     def _normalize_id(identifier: str) -> str:
         """Normalize an identifier to lowercase with hyphens."""
-        # Convert to lowercase
-        normalized = identifier.lower()
-        # Replace underscores with hyphens
-        normalized = normalized.replace('_', '-')
-        # Remove any spaces
-        normalized = normalized.replace(' ', '-')
+        # Lowercase, then map underscores and spaces to hyphens in one pass
+        normalized = identifier.lower().translate(_ID_SEPARATOR_TABLE)
         # Collapse multiple hyphens
-        normalized = re.sub(r'-+', '-', normalized)
+        if '--' in normalized:
+            normalized = _HYPHEN_RUN_RE.sub('-', normalized)
         # Remove leading/trailing hyphens
         normalized = normalized.strip('-')
         return normalized
 
 
+# parse_urn() helpers: each takes the URN with its "{type}:" prefix removed
+
+def _parse_wagon(rest: str) -> dict:
+    return {
+        'type': 'wagon',
+        'wagon_id': rest
+    }
+
+
+def _parse_feature(rest: str) -> dict:
+    parts = rest.split(':')
+    return {
+        'type': 'feature',
+        'wagon_id': parts[0],
+        'feature_id': parts[1] if len(parts) > 1 else None
+    }
+
+
+def _parse_wmbt(rest: str) -> dict:
+    parts = rest.split(':')
+    return {
+        'type': 'wmbt',
+        'wagon_id': parts[0],
+        'sequence': parts[1] if len(parts) > 1 else None
+    }
+
+
+def _parse_acc(rest: str) -> dict:
+    parts = rest.split(':')
+    # Format: wagon_id:wmbt_id-harness-seq[-slug]
+    result = {
+        'type': 'acceptance',
+        'wagon_id': parts[0] if len(parts) > 0 else None,
+    }
+
+    # Parse facets: wmbt_id-harness-seq[-slug]
+    if len(parts) > 1:
+        facets = parts[1].split('-')
+        if len(facets) >= 3:
+            result['wmbt_id'] = facets[0]  # e.g., C004
+            result['harness'] = facets[1]  # e.g., E2E
+            result['sequence'] = facets[2]  # e.g., 019
+            # Optional slug (remaining parts joined with hyphens)
+            if len(facets) > 3:
+                result['slug'] = '-'.join(facets[3:])
+
+    return result
+
+
+def _parse_test(main_part: str) -> dict:
+    # V3 journey format: test:train:{train_id}:{HARNESS}-{NNN}-{slug}
+    head, sep, rest = main_part.partition(':')
+    if head == 'train' and sep:
+        train_id, sep, tail = rest.partition(':')
+        if sep and train_id:
+            # Parse: {HARNESS}-{NNN}-{slug}
+            segments = tail.split('-', 2)
+            return {
+                'type': 'test',
+                'format': 'journey',
+                'train_id': train_id,
+                'harness': segments[0] if len(segments) > 0 else None,
+                'sequence': segments[1] if len(segments) > 1 else None,
+                'slug': segments[2] if len(segments) > 2 else None,
+            }
+        return {'type': 'test', 'format': 'journey', 'train_id': rest}
+
+    # V3 acceptance format: test:{wagon}:{feature}:{WMBT_ID}-{HARNESS}-{NNN}-{slug}
+    # Exactly three ':' fields; reuses the partition above instead of split()
+    if sep:
+        feature_id, sep, tail = rest.partition(':')
+    if sep and ':' not in tail:
+        wagon_id = head
+        # Parse tail: {WMBT_ID}-{HARNESS}-{NNN}-{slug}
+        # First 3 dash-segments = WMBT_ID, HARNESS, NNN; rest = slug
+        segments = tail.split('-', 3)
+        if len(segments) >= 3 and _is_test_wmbt_id(segments[0]):
+            return {
+                'type': 'test',
+                'format': 'acceptance',
+                'wagon_id': wagon_id,
+                'feature_id': feature_id,
+                'wmbt_id': segments[0],
+                'harness': segments[1],
+                'sequence': segments[2],
+                'slug': segments[3] if len(segments) > 3 else None,
+            }
+
+    # Legacy dot format: test:wagon.feature.tc-name
+    parts = main_part.split('.')
+    test_case = parts[-1] if parts else None
+    result = {
+        'type': 'test',
+        'format': 'legacy',
+        'wagon_id': parts[0] if len(parts) > 0 else None,
+        'test_case': test_case
+    }
+    if len(parts) > 2:
+        result['feature_id'] = parts[1]
+    if len(parts) > 5:
+        result['component_name'] = parts[2]
+        result['side'] = parts[3]
+        result['layer'] = parts[4]
+    return result
+
+
+def _parse_component(rest: str) -> dict:
+    parts = rest.split(':')
+    return {
+        'type': 'component',
+        'wagon_id': parts[0] if len(parts) > 0 else None,
+        'feature_id': parts[1] if len(parts) > 1 else None,
+        'component_name': parts[2] if len(parts) > 2 else None,
+        'side': parts[3] if len(parts) > 3 else None,
+        'layer': parts[4] if len(parts) > 4 else None
+    }
+
+
+_PARSERS = {
+    'wagon': _parse_wagon,
+    'feature': _parse_feature,
+    'wmbt': _parse_wmbt,
+    'acc': _parse_acc,
+    'test': _parse_test,
+    'component': _parse_component,
+}
+
+
+# Builders bound once at import: hot callers can use these directly and skip
+# the URNBuilder attribute lookup and classmethod binding on every call.
+build_wagon = URNBuilder.wagon
+build_feature = URNBuilder.feature
+build_wmbt = URNBuilder.wmbt
+build_acceptance = URNBuilder.acceptance
+build_component = URNBuilder.component
+
+# main() commands served without argparse: name -> (argument count, builder)
+_CLI_FAST_BUILDERS = {
+    'wagon': (1, build_wagon),
+    'feature': (2, build_feature),
+    'wmbt': (2, build_wmbt),
+}
+
+
 def main() -> int:
     """CLI interface for URN generation."""
-    import argparse
     import json
 
+    # Fast path for the common one-shot calls (e.g. per file in a hook):
+    # exact positional arguments skip building the argparse tree. Anything
+    # else, including --help and choice-checked commands, goes to argparse.
+    argv = sys.argv[1:]
+    if argv and not any(arg.startswith('-') for arg in argv):
+        entity, *values = argv
+        builder = _CLI_FAST_BUILDERS.get(entity)
+        if (builder is not None and len(values) == builder[0]) or (
+            entity == 'parse' and len(values) == 1
+        ):
+            try:
+                if entity == 'parse':
+                    print(json.dumps(URNBuilder.parse_urn(values[0]), indent=2))
+                else:
+                    print(builder[1](*values))
+            except ValueError as exc:
+                print(f"Error: {exc}", file=sys.stderr)
+                return 1
+            return 0
+
+    import argparse
+
     parser = argparse.ArgumentParser(description='Generate URNs for ATDD entities')
     subparsers = parser.add_subparsers(dest='entity', help='Entity type')
 
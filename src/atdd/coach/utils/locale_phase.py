@@ -6,10 +6,10 @@ Manages the phased rollout of localization validation rules:
 - Phase 2 (TESTER_ENFORCEMENT): Tester phase validators (LOCALE-TEST-*) strict
 - Phase 3 (FULL_ENFORCEMENT): All validators including Coder (LOCALE-CODE-*) strict
 
-Usage in validators:
-    from atdd.coach.utils.locale_phase import LocalePhase, should_enforce_locale
+Usage in validators (should_enforce_locale() remains for phases chosen at runtime):
+    from atdd.coach.utils.locale_phase import ENFORCE_LOCALE_TESTER, LocalePhase
 
-    if should_enforce_locale(LocalePhase.TESTER_ENFORCEMENT):
+    if ENFORCE_LOCALE_TESTER:
         assert condition, "Error message"
     else:
         if not condition:
@@ -20,6 +20,8 @@ from enum import IntEnum
 from typing import Optional
 import warnings
 
+from atdd.coach.utils.warning_filters import user_warnings_ignored
+
 
 class LocalePhase(IntEnum):
     """
@@ -38,6 +40,10 @@ class LocalePhase(IntEnum):
 # Current rollout phase - update this to advance through phases
 CURRENT_LOCALE_PHASE = LocalePhase.WARNINGS_ONLY
 
+# Precomputed for hot validator loops; the phase is fixed at import time
+ENFORCE_LOCALE_TESTER = CURRENT_LOCALE_PHASE >= LocalePhase.TESTER_ENFORCEMENT
+ENFORCE_LOCALE_FULL = CURRENT_LOCALE_PHASE >= LocalePhase.FULL_ENFORCEMENT
+
 
 def should_enforce_locale(validator_phase: LocalePhase) -> bool:
     """
@@ -66,14 +72,17 @@ def get_current_locale_phase() -> LocalePhase:
     return CURRENT_LOCALE_PHASE
 
 
+_LOCALE_PHASE_NAMES = {
+    LocalePhase.WARNINGS_ONLY: "Phase 1: Warnings Only",
+    LocalePhase.TESTER_ENFORCEMENT: "Phase 2: Tester Enforcement",
+    LocalePhase.FULL_ENFORCEMENT: "Phase 3: Full Enforcement",
+}
+
+
 def get_locale_phase_name(phase: Optional[LocalePhase] = None) -> str:
     """Get human-readable name for a locale phase."""
     phase = phase or CURRENT_LOCALE_PHASE
-    return {
-        LocalePhase.WARNINGS_ONLY: "Phase 1: Warnings Only",
-        LocalePhase.TESTER_ENFORCEMENT: "Phase 2: Tester Enforcement",
-        LocalePhase.FULL_ENFORCEMENT: "Phase 3: Full Enforcement",
-    }.get(phase, "Unknown Phase")
+    return _LOCALE_PHASE_NAMES.get(phase, "Unknown Phase")
 
 
 def emit_locale_warning(
@@ -89,6 +98,9 @@ def emit_locale_warning(
         message: The warning message
         validator_phase: Phase when this becomes an error
     """
+    # Skip formatting when the message would be discarded (e.g. -W ignore)
+    if user_warnings_ignored():
+        return
     phase_name = get_locale_phase_name(validator_phase)
     warnings.warn(
         f"[{spec_id}] {message} (will become error in {phase_name})",
@@ -20,7 +20,6 @@ from pathlib import Path
 from typing import Optional
 
 
-@lru_cache(maxsize=1)
 def find_repo_root(start: Optional[Path] = None) -> Path:
     """
     Find repo root by searching upward for ATDD project markers.
@@ -39,8 +38,10 @@ def find_repo_root(start: Optional[Path] = None) -> Path:
         Path to repo root (falls back to cwd if no markers found)
 
     Note:
-        Results are cached for performance. If .atdd/manifest.yaml is not found,
-        commands may operate in a degraded mode.
+        The upward walk is cached per resolved starting directory; call
+        find_repo_root.cache_clear() after creating or removing markers.
+        If .atdd/manifest.yaml is not found, commands may operate in a
+        degraded mode.
 
         For validators running from installed package, ATDD_REPO_ROOT env var
         is set by the test runner to point to the consumer repo.
@@ -52,27 +53,57 @@ def find_repo_root(start: Optional[Path] = None) -> Path:
         if env_path.is_dir():
             return env_path
 
-    current = start or Path.cwd()
-    current = current.resolve()
+    # Resolve before the cache lookup so equivalent paths share one entry
+    return _find_repo_root_from((start or Path.cwd()).resolve())
 
-    while current != current.parent:
+
+@lru_cache(maxsize=128)
+def _find_repo_root_from(start: Path) -> Path:
+    """Walk upward from a resolved directory; see find_repo_root()."""
+    # Plain os.path on strings: no Path object per probe
+    isdir, isfile, join = os.path.isdir, os.path.isfile, os.path.join
+    current = os.fspath(start)
+    parent = os.path.dirname(current)
+
+    while current != parent:
         # Strategy 1: .atdd/manifest.yaml (preferred)
-        if (current / ".atdd" / "manifest.yaml").is_file():
-            return current
+        if isfile(join(current, ".atdd", "manifest.yaml")):
+            return Path(current)
 
         # Strategy 2: plan/ AND contracts/ both exist
-        if (current / "plan").is_dir() and (current / "contracts").is_dir():
-            return current
+        if isdir(join(current, "plan")) and isdir(join(current, "contracts")):
+            return Path(current)
 
         # Strategy 3: .git/ directory (fallback)
-        if (current / ".git").is_dir():
-            return current
+        if isdir(join(current, ".git")):
+            return Path(current)
 
-        current = current.parent
+        current, parent = parent, os.path.dirname(parent)
 
     # Strategy 4: Return starting directory as last resort
     # Commands can handle uninitialized repos appropriately
-    return start.resolve() if start else Path.cwd().resolve()
+    return start
+
+
+find_repo_root.cache_clear = _find_repo_root_from.cache_clear
+
+
+def atdd_cache_dir(repo_root: Path) -> Path:
+    """
+    Return the repo-local cache directory, .atdd/cache/, creating it if needed.
+
+    A .gitignore ignoring everything is written on creation so cached data
+    never shows up as untracked files in the consumer repo.
+
+    Raises:
+        OSError: If the directory cannot be created
+    """
+    cache_dir = repo_root / ".atdd" / "cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    gitignore = cache_dir / ".gitignore"
+    if not gitignore.exists():
+        gitignore.write_text("# Local atdd caches; safe to delete\n*\n", encoding="utf-8")
+    return cache_dir
 
 
 def detect_worktree_layout(start: Optional[Path] = None) -> str:
@@ -6,10 +6,10 @@ Manages the phased rollout of train validation rules:
 - Phase 2 (BACKEND_ENFORCEMENT): Backend validators become strict
 - Phase 3 (FULL_ENFORCEMENT): All validators become strict
 
-Usage in validators:
-    from atdd.coach.utils.train_spec_phase import TrainSpecPhase, should_enforce
+Usage in validators (should_enforce() remains for phases chosen at runtime):
+    from atdd.coach.utils.train_spec_phase import ENFORCE_BACKEND
 
-    if should_enforce(TrainSpecPhase.BACKEND_ENFORCEMENT):
+    if ENFORCE_BACKEND:
         assert condition, "Error message"
     else:
         if not condition:
@@ -20,6 +20,8 @@ from enum import IntEnum
 from typing import Optional
 import warnings
 
+from atdd.coach.utils.warning_filters import user_warnings_ignored
+
 
 class TrainSpecPhase(IntEnum):
     """
@@ -38,6 +40,10 @@ class TrainSpecPhase(IntEnum):
 # Current rollout phase - update this to advance through phases
 CURRENT_PHASE = TrainSpecPhase.WARNINGS_ONLY
 
+# Precomputed for hot validator loops; the phase is fixed at import time
+ENFORCE_BACKEND = CURRENT_PHASE >= TrainSpecPhase.BACKEND_ENFORCEMENT
+ENFORCE_FULL = CURRENT_PHASE >= TrainSpecPhase.FULL_ENFORCEMENT
+
 
 def should_enforce(validator_phase: TrainSpecPhase) -> bool:
     """
@@ -66,14 +72,17 @@ def get_current_phase() -> TrainSpecPhase:
     return CURRENT_PHASE
 
 
+_PHASE_NAMES = {
+    TrainSpecPhase.WARNINGS_ONLY: "Phase 1: Warnings Only",
+    TrainSpecPhase.BACKEND_ENFORCEMENT: "Phase 2: Backend Enforcement",
+    TrainSpecPhase.FULL_ENFORCEMENT: "Phase 3: Full Enforcement",
+}
+
+
 def get_phase_name(phase: Optional[TrainSpecPhase] = None) -> str:
     """Get human-readable name for a phase."""
     phase = phase or CURRENT_PHASE
-    return {
-        TrainSpecPhase.WARNINGS_ONLY: "Phase 1: Warnings Only",
-        TrainSpecPhase.BACKEND_ENFORCEMENT: "Phase 2: Backend Enforcement",
-        TrainSpecPhase.FULL_ENFORCEMENT: "Phase 3: Full Enforcement",
-    }.get(phase, "Unknown Phase")
+    return _PHASE_NAMES.get(phase, "Unknown Phase")
 
 
 def emit_phase_warning(
@@ -89,6 +98,9 @@ def emit_phase_warning(
         message: The warning message
         validator_phase: Phase when this becomes an error
     """
+    # Skip formatting when the message would be discarded (e.g. -W ignore)
+    if user_warnings_ignored():
+        return
     phase_name = get_phase_name(validator_phase)
     warnings.warn(
         f"[{spec_id}] {message} (will become error in {phase_name})",
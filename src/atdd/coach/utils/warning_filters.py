@@ -0,0 +1,25 @@
+"""
+Warning filter inspection for the rollout phase controllers.
+
+The emit_*_warning() helpers in coverage_phase, locale_phase and
+train_spec_phase use user_warnings_ignored() to skip formatting messages
+that the active filters would discard anyway (e.g. -W ignore).
+"""
+
+import warnings
+
+
+def user_warnings_ignored() -> bool:
+    """
+    True if the active filters drop every UserWarning unconditionally.
+
+    Only the first filter that could apply is consulted; one that depends
+    on message text, module or line number means the answer is unknown.
+    """
+    for action, message, category, module, lineno in warnings.filters:
+        if not issubclass(UserWarning, category):
+            continue
+        if message is None and module is None and not lineno:
+            return action == "ignore"
+        return False
+    return False
@@ -7,15 +7,32 @@ platform tests, eliminating redundant API calls.
 Key optimization: ``github_project_items`` fetches ALL project items with
 their field values in a single GraphQL query, replacing the N+1 pattern
 of get_project_item_id + get_project_item_field_values per issue.
+
+With ATDD_GITHUB_CACHE=1, issue lists and project fields are also kept in
+.atdd/cache/ for GITHUB_CACHE_TTL seconds so repeated local runs skip the
+round-trips; by default every session fetches live data. The independent queries that
+collected tests need, including the batch project-item and sub-issue
+queries, are started together in threads after collection (see
+pytest_collection_finish).
 """
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
 import pytest
 
-from atdd.coach.utils.repo import find_repo_root
+from atdd.coach.utils.repo import atdd_cache_dir, find_repo_root
 from atdd.coach.validators.shared_fixtures import *  # noqa: F401,F403
 
 
 REPO_ROOT = find_repo_root()
 
+GITHUB_CACHE_DIR = REPO_ROOT / ".atdd" / "cache"
+GITHUB_CACHE_TTL = 300
+
 
 def _build_github_client():
     """Build a GitHubClient from .atdd/config.yaml. Returns client or None."""
@@ -32,10 +49,118 @@ def _build_github_client():
         return None
 
 
+def _cached_github(client, key: str, fetcher):
+    """
+    Return fetcher()'s JSON result, reusing a copy on disk for GITHUB_CACHE_TTL.
+
+    Only active with ATDD_GITHUB_CACHE=1; results may then be up to
+    GITHUB_CACHE_TTL seconds old. The cache file is keyed by repo, project
+    and ``key``. Errors raised by fetcher() propagate and nothing is written;
+    cache I/O problems fall back to fetching.
+    """
+    if os.environ.get("ATDD_GITHUB_CACHE") != "1":
+        return fetcher()
+
+    digest = hashlib.blake2b(
+        f"{client.repo}|{client.project_id}|{key}".encode(), digest_size=8
+    ).hexdigest()
+    path = GITHUB_CACHE_DIR / f"github-{digest}.json"
+    try:
+        if time.time() - path.stat().st_mtime < GITHUB_CACHE_TTL:
+            return json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        pass
+
+    data = fetcher()
+    try:
+        atdd_cache_dir(REPO_ROOT)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError):
+        pass
+    return data
+
+
+# Independent queries behind the session fixtures: cache key -> fetch
+_GITHUB_QUERIES = {
+    "issues:atdd-issue": lambda client: client.list_issues_by_label("atdd-issue"),
+    "issues:atdd:COMPLETE": lambda client: client.list_issues_by_label("atdd:COMPLETE"),
+    "project-fields": lambda client: client.get_project_fields(),
+}
+# Batch queries keyed by issue number; JSON would stringify the keys, so
+# these are prefetched but never written to the disk cache
+_GITHUB_BATCH_QUERIES = {
+    "project-items": lambda client: client.get_all_project_items(),
+    "sub-issues:OPEN": lambda client: client.get_all_sub_issues("atdd-issue", "OPEN"),
+    "sub-issues:CLOSED": lambda client: client.get_all_sub_issues("atdd-issue", "CLOSED"),
+}
+_GITHUB_QUERY_FIXTURES = {
+    "github_issues": "issues:atdd-issue",
+    "github_complete_issues": "issues:atdd:COMPLETE",
+    "github_project_fields": "project-fields",
+    "github_project_items": "project-items",
+    "github_sub_issues": "sub-issues:OPEN",
+    "github_closed_sub_issues": "sub-issues:CLOSED",
+}
+
+# Client and in-flight futures from pytest_collection_finish
+_github_prefetch = {}
+_github_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _fetch_github(client, key: str):
+    """Run the query behind ``key``, through the disk cache where allowed."""
+    if key in _GITHUB_BATCH_QUERIES:
+        return _GITHUB_BATCH_QUERIES[key](client)
+    return _cached_github(client, key, lambda: _GITHUB_QUERIES[key](client))
+
+
+def _github_query(client, key: str):
+    """Return a query result, waiting on its prefetch if started."""
+    future = _github_prefetch.get(key)
+    if future is not None:
+        return future.result()
+    return _fetch_github(client, key)
+
+
+def pytest_collection_finish(session):
+    """Start the GitHub queries collected tests need, in parallel."""
+    global _github_executor
+    if session.config.option.collectonly:
+        return
+    keys = {
+        _GITHUB_QUERY_FIXTURES[name]
+        for item in session.items
+        for name in getattr(item, "fixturenames", ())
+        if name in _GITHUB_QUERY_FIXTURES
+    }
+    if not keys:
+        return
+    client = _build_github_client()
+    if client is None:
+        return
+    _github_prefetch["client"] = client
+    _github_executor = ThreadPoolExecutor(
+        max_workers=len(keys), thread_name_prefix="atdd-github"
+    )
+    for key in keys:
+        _github_prefetch[key] = _github_executor.submit(_fetch_github, client, key)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Cancel prefetches no test waited for and join the worker threads."""
+    global _github_executor
+    if _github_executor is not None:
+        _github_executor.shutdown(wait=True, cancel_futures=True)
+        _github_executor = None
+    _github_prefetch.clear()
+
+
 @pytest.fixture(scope="session")
 def github_client():
     """Session-scoped GitHubClient (created once, shared across all tests)."""
-    client = _build_github_client()
+    client = _github_prefetch.get("client") or _build_github_client()
     if client is None:
         pytest.skip("GitHub integration not configured (no .atdd/config.yaml)")
     return client
@@ -50,7 +175,7 @@ def github_issues(github_client):
     from atdd.coach.github import GitHubClientError
 
     try:
-        issues = github_client.list_issues_by_label("atdd-issue")
+        issues = _github_query(github_client, "issues:atdd-issue")
     except GitHubClientError as e:
         pytest.skip(f"Cannot query GitHub: {e}")
 
@@ -66,7 +191,7 @@ def github_complete_issues(github_client):
     from atdd.coach.github import GitHubClientError
 
     try:
-        issues = github_client.list_issues_by_label("atdd:COMPLETE")
+        issues = _github_query(github_client, "issues:atdd:COMPLETE")
     except GitHubClientError as e:
         pytest.skip(f"Cannot query GitHub: {e}")
 
@@ -82,7 +207,7 @@ def github_project_fields(github_client):
     from atdd.coach.github import GitHubClientError
 
     try:
-        return github_client.get_project_fields()
+        return _github_query(github_client, "project-fields")
     except GitHubClientError as e:
         pytest.skip(f"Cannot query Project v2 fields (needs 'project' scope): {e}")
 
@@ -98,7 +223,7 @@ def github_project_items(github_client):
     from atdd.coach.github import GitHubClientError
 
     try:
-        return github_client.get_all_project_items()
+        return _github_query(github_client, "project-items")
     except GitHubClientError as e:
         pytest.skip(f"Cannot query project items: {e}")
 
@@ -113,7 +238,7 @@ def github_sub_issues(github_client):
     from atdd.coach.github import GitHubClientError
 
     try:
-        return github_client.get_all_sub_issues("atdd-issue", "OPEN")
+        return _github_query(github_client, "sub-issues:OPEN")
     except GitHubClientError as e:
         pytest.skip(f"Cannot batch-query sub-issues: {e}")
 
@@ -128,6 +253,6 @@ def github_closed_sub_issues(github_client):
     from atdd.coach.github import GitHubClientError
 
     try:
-        return github_client.get_all_sub_issues("atdd-issue", "CLOSED")
+        return _github_query(github_client, "sub-issues:CLOSED")
     except GitHubClientError as e:
         pytest.skip(f"Cannot batch-query closed sub-issues: {e}")
@@ -11,10 +11,16 @@ Validators should use:
 - REPO_ROOT for consumer repo artifacts (plan/, contracts/, telemetry/, web/, python/)
 - ATDD_PKG_DIR for package-bundled resources (schemas, conventions, templates)
 """
+import copy
 import json
+import os
+import re
+import sys
 import yaml
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, List, Sequence, Tuple, Optional
 import pytest
 
 import atdd
@@ -33,120 +39,296 @@ WEB_DIR = REPO_ROOT / "web"
 # Package resources - use atdd.__file__ to locate installed package
 ATDD_PKG_DIR = Path(atdd.__file__).resolve().parent
 
+# libyaml-backed parser when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _yaml_load(stream) -> Any:
+    """yaml.safe_load() using the C loader when available; accepts bytes."""
+    return yaml.load(stream, Loader=_YAML_LOADER)
+
+
+# orjson parses the same documents faster; optional, stdlib json otherwise
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Reads are I/O-bound, so allow more threads than cores (capped like the
+# ThreadPoolExecutor default)
+_YAML_LOAD_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _load_yaml_files(
+    paths: Sequence[Path], skip_errors: bool = True,
+    max_workers: int = _YAML_LOAD_WORKERS,
+) -> List[Tuple[Path, Any]]:
+    """
+    Parse many YAML files concurrently, returning (path, data) in input order.
+
+    Threads overlap the file reads on a cold cache; small batches are parsed
+    inline to skip pool start-up. With skip_errors, a file that cannot be
+    read or parsed yields data=None instead of raising.
+    """
+    def _load(path: Path) -> Tuple[Path, Any]:
+        try:
+            return path, _yaml_load(path.read_bytes())
+        except Exception:
+            if not skip_errors:
+                raise
+            return path, None
+
+    if len(paths) < 2:
+        return [_load(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+        return list(executor.map(_load, paths))
+
+
+# WMBT files: [DLPCEMYRK]NNN.yaml (e.g., D001.yaml, L010.yaml)
+_WMBT_FILENAME_RE = re.compile(r"^[DLPCEMYRK]\d{3}\.yaml$")
+
+
+@lru_cache(maxsize=None)
+def _plan_index(plan_dir: str) -> Dict[str, Tuple[Path, ...]]:
+    """
+    Scan plan/ once for wagon manifests, feature files and WMBT files.
+
+    Each wagon directory (plan/*, skipping "_" prefixes) is listed with a
+    single os.scandir pass; only a features/ subdirectory is listed again.
+    Paths keep directory listing order, as Path.iterdir()/glob() produced.
+
+    Returns:
+        {"manifests": plan/*/_*.yaml, "features": plan/*/features/*.yaml,
+         "wmbts": plan/*/[DLPCEMYRK]NNN.yaml}
+    """
+    manifests: List[Path] = []
+    features: List[Path] = []
+    wmbts: List[Path] = []
+    try:
+        wagon_dirs = [
+            entry.path for entry in os.scandir(plan_dir)
+            if entry.is_dir() and not entry.name.startswith("_")
+        ]
+    except OSError:
+        wagon_dirs = []
+
+    for wagon_dir in wagon_dirs:
+        try:
+            with os.scandir(wagon_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.endswith(".yaml"):
+                        if name.startswith("_"):
+                            manifests.append(Path(entry.path))
+                        elif _WMBT_FILENAME_RE.match(name):
+                            wmbts.append(Path(entry.path))
+                    elif name == "features" and entry.is_dir():
+                        with os.scandir(entry.path) as feature_entries:
+                            features.extend(
+                                Path(feature.path) for feature in feature_entries
+                                if feature.name.endswith(".yaml")
+                            )
+        except OSError:
+            continue
+
+    return {
+        "manifests": tuple(manifests),
+        "features": tuple(features),
+        "wmbts": tuple(wmbts),
+    }
+
+
+def _find_files(root: Path, suffixes: Tuple[str, ...]) -> List[Path]:
+    """
+    Recursively collect files under root whose name ends with any suffix.
+
+    Explicit os.scandir stack; like Path.rglob(), symlinked directories are
+    not descended into. A missing root yields an empty list.
+    """
+    found: List[Path] = []
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(suffixes):
+                        found.append(Path(entry.path))
+        except OSError:
+            continue
+    return found
+
+
+@lru_cache(maxsize=None)
+def _load_json_cached(path_str: str) -> Dict[str, Any]:
+    """Read and parse a JSON file once per process (package schemas are static)."""
+    return _json_loads(Path(path_str).read_bytes())
+
+
+def _load_json(path_str: str) -> Dict[str, Any]:
+    """
+    Private copy of a cached JSON file, for fixtures handed to tests.
+
+    Tests may edit the schemas they receive; copying keeps those edits out
+    of the shared cache that _schema_validator() and later fixtures read.
+    """
+    return copy.deepcopy(_load_json_cached(path_str))
+
+
+@lru_cache(maxsize=None)
+def _schema_validator(path_str: str):
+    """
+    Build a checked jsonschema validator for a schema file once per process.
+
+    Uses the same draft selection and schema check as jsonschema.validate(),
+    so ``best_match(validator.iter_errors(instance))`` reports the same error.
+    """
+    from jsonschema.validators import validator_for
+
+    schema = _load_json_cached(path_str)
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
 
 # Schema fixtures - Planner schemas (loaded from installed package)
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def wagon_schema() -> Dict[str, Any]:
     """Load wagon.schema.json for validation."""
-    with open(ATDD_PKG_DIR / "planner/schemas/wagon.schema.json") as f:
-        return json.load(f)
+    return _load_json(str(ATDD_PKG_DIR / "planner/schemas/wagon.schema.json"))
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def wmbt_schema() -> Dict[str, Any]:
     """Load wmbt.schema.json for validation."""
-    with open(ATDD_PKG_DIR / "planner/schemas/wmbt.schema.json") as f:
-        return json.load(f)
+    return _load_json(str(ATDD_PKG_DIR / "planner/schemas/wmbt.schema.json"))
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def feature_schema() -> Dict[str, Any]:
     """Load feature.schema.json for validation."""
-    with open(ATDD_PKG_DIR / "planner/schemas/feature.schema.json") as f:
-        return json.load(f)
+    return _load_json(str(ATDD_PKG_DIR / "planner/schemas/feature.schema.json"))
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def acceptance_schema() -> Dict[str, Any]:
     """Load acceptance.schema.json for validation."""
-    with open(ATDD_PKG_DIR / "planner/schemas/acceptance.schema.json") as f:
-        return json.load(f)
+    return _load_json(str(ATDD_PKG_DIR / "planner/schemas/acceptance.schema.json"))
+
+
+# Compiled validators for the planner schemas (requires jsonschema)
+@pytest.fixture(scope="session")
+def wagon_validator():
+    """Checked validator for wagon.schema.json."""
+    return _schema_validator(str(ATDD_PKG_DIR / "planner/schemas/wagon.schema.json"))
+
+
+@pytest.fixture(scope="session")
+def wmbt_validator():
+    """Checked validator for wmbt.schema.json."""
+    return _schema_validator(str(ATDD_PKG_DIR / "planner/schemas/wmbt.schema.json"))
+
+
+@pytest.fixture(scope="session")
+def feature_validator():
+    """Checked validator for feature.schema.json."""
+    return _schema_validator(str(ATDD_PKG_DIR / "planner/schemas/feature.schema.json"))
+
+
+@pytest.fixture(scope="session")
+def acceptance_validator():
+    """Checked validator for acceptance.schema.json."""
+    return _schema_validator(str(ATDD_PKG_DIR / "planner/schemas/acceptance.schema.json"))
 
 
 # Schema fixtures - Tester schemas (loaded from installed package)
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def telemetry_signal_schema() -> Dict[str, Any]:
     """Load telemetry_signal.schema.json for validation."""
     schema_path = ATDD_PKG_DIR / "tester/schemas/telemetry_signal.schema.json"
     if schema_path.exists():
-        with open(schema_path) as f:
-            return json.load(f)
+        return _load_json(str(schema_path))
     return {}
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def telemetry_tracking_manifest_schema() -> Dict[str, Any]:
     """Load telemetry_tracking_manifest.schema.json for validation."""
     schema_path = ATDD_PKG_DIR / "tester/schemas/telemetry_tracking_manifest.schema.json"
     if schema_path.exists():
-        with open(schema_path) as f:
-            return json.load(f)
+        return _load_json(str(schema_path))
     return {}
 
 
 # Generic schema loader (loads from installed package)
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def load_schema():
     """Factory fixture to load any schema by path."""
-    def _loader(agent: str, schema_name: str) -> Dict[str, Any]:
+    def _loader(agent: str, schema_name: str, compiled: bool = False):
         """
         Load a schema from the installed atdd package.
 
         Args:
             agent: Agent name (planner, tester, coach, coder)
             schema_name: Schema filename (e.g., "wagon.schema.json")
+            compiled: Return a checked jsonschema validator instead of the dict
 
         Returns:
-            Parsed JSON schema
+            Parsed JSON schema, or its cached validator when compiled=True
         """
         schema_path = ATDD_PKG_DIR / agent / "schemas" / schema_name
         if not schema_path.exists():
             raise FileNotFoundError(f"Schema not found: {schema_path}")
-        with open(schema_path) as f:
-            return json.load(f)
+        if compiled:
+            return _schema_validator(str(schema_path))
+        return _load_json(str(schema_path))
     return _loader
 
 
 # File discovery fixtures
-@pytest.fixture(scope="module")
-def wagon_manifests() -> List[Tuple[Path, Dict[str, Any]]]:
+@pytest.fixture(scope="session")
+def wagon_manifests(atdd_config: Dict[str, Any]) -> List[Tuple[Path, Dict[str, Any]]]:
     """
     Discover all wagon manifests in plan/.
 
+    discovery.manifest_source in .atdd/config.yaml selects the sources:
+    "registry" (plan/_wagons.yaml), "filesystem" (plan/*/_*.yaml) or
+    "both" (default).
+
     Returns:
         List of (path, manifest_data) tuples
     """
     manifests = []
+    seen = set()
+    source = atdd_config.get("discovery", {}).get("manifest_source", "both")
 
     # Load from _wagons.yaml registry
     wagons_file = PLAN_DIR / "_wagons.yaml"
-    if wagons_file.exists():
-        with open(wagons_file) as f:
-            wagons_data = yaml.safe_load(f)
-            for wagon_entry in wagons_data.get("wagons", []):
-                if "manifest" in wagon_entry:
-                    manifest_path = REPO_ROOT / wagon_entry["manifest"]
-                    if manifest_path.exists():
-                        with open(manifest_path) as mf:
-                            manifest_data = yaml.safe_load(mf)
-                            manifests.append((manifest_path, manifest_data))
+    if source != "filesystem" and wagons_file.exists():
+        wagons_data = _yaml_load(wagons_file.read_bytes())
+        for wagon_entry in wagons_data.get("wagons", []):
+            if "manifest" in wagon_entry:
+                manifest_path = REPO_ROOT / wagon_entry["manifest"]
+                if manifest_path.exists():
+                    manifest_data = _yaml_load(manifest_path.read_bytes())
+                    manifests.append((manifest_path, manifest_data))
+                    seen.add(manifest_path)
+
+    if source == "registry":
+        return manifests
 
     # Also discover individual wagon manifests (pattern: plan/*/_{wagon}.yaml)
-    if not PLAN_DIR.exists():
-        return manifests
-    for wagon_dir in PLAN_DIR.iterdir():
-        if wagon_dir.is_dir() and not wagon_dir.name.startswith("_"):
-            for manifest_file in wagon_dir.glob("_*.yaml"):
-                manifest_path = manifest_file
-                if manifest_path not in [m[0] for m in manifests]:
-                    with open(manifest_path) as f:
-                        manifest_data = yaml.safe_load(f)
-                        manifests.append((manifest_path, manifest_data))
+    pending = [
+        manifest_path for manifest_path in _plan_index(str(PLAN_DIR))["manifests"]
+        if manifest_path not in seen
+    ]
+    manifests.extend(_load_yaml_files(pending, skip_errors=False))
 
     return manifests
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def trains_registry() -> Dict[str, Any]:
     """
     Load trains registry from plan/_trains.yaml.
@@ -157,26 +339,25 @@ def trains_registry() -> Dict[str, Any]:
     """
     trains_file = PLAN_DIR / "_trains.yaml"
     if trains_file.exists():
-        with open(trains_file) as f:
-            data = yaml.safe_load(f)
-            trains_data = data.get("trains", {})
-
-            # Flatten the nested structure
-            # Input: {"0-commons": {"00-commons-nominal": [train1, train2], ...}, ...}
-            # Output: {"commons": [train1, train2, ...], ...}
-            flattened = {}
-            for theme_key, categories in trains_data.items():
-                # Extract theme name (e.g., "0-commons" -> "commons")
-                theme = theme_key.split("-", 1)[1] if "-" in theme_key else theme_key
-                flattened[theme] = []
-
-                # Flatten all category lists into single theme list
-                if isinstance(categories, dict):
-                    for category_key, trains_list in categories.items():
-                        if isinstance(trains_list, list):
-                            flattened[theme].extend(trains_list)
-
-            return flattened
+        data = _yaml_load(trains_file.read_bytes())
+        trains_data = data.get("trains", {})
+
+        # Flatten the nested structure
+        # Input: {"0-commons": {"00-commons-nominal": [train1, train2], ...}, ...}
+        # Output: {"commons": [train1, train2, ...], ...}
+        flattened = {}
+        for theme_key, categories in trains_data.items():
+            # Extract theme name (e.g., "0-commons" -> "commons")
+            theme = theme_key.split("-", 1)[1] if "-" in theme_key else theme_key
+            flattened[theme] = []
+
+            # Flatten all category lists into single theme list
+            if isinstance(categories, dict):
+                for category_key, trains_list in categories.items():
+                    if isinstance(trains_list, list):
+                        flattened[theme].extend(trains_list)
+
+        return flattened
 
     # Return empty theme-grouped structure
     return {
@@ -193,7 +374,7 @@ def trains_registry() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def trains_registry_with_groups() -> Dict[str, Dict[str, List[Dict]]]:
     """
     Load trains registry preserving full group structure for theme validation.
@@ -206,13 +387,12 @@ def trains_registry_with_groups() -> Dict[str, Dict[str, List[Dict]]]:
     """
     trains_file = PLAN_DIR / "_trains.yaml"
     if trains_file.exists():
-        with open(trains_file) as f:
-            data = yaml.safe_load(f)
-            return data.get("trains", {})
+        data = _yaml_load(trains_file.read_bytes())
+        return data.get("trains", {})
     return {}
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def train_files() -> List[Tuple[Path, Dict]]:
     """
     Load all train YAML files with their data.
@@ -223,21 +403,23 @@ def train_files() -> List[Tuple[Path, Dict]]:
     trains_dir = PLAN_DIR / "_trains"
     train_files_data = []
 
-    if trains_dir.exists():
-        for train_file in sorted(trains_dir.glob("*.yaml")):
-            if not train_file.name.startswith("_"):
-                try:
-                    with open(train_file) as f:
-                        train_data = yaml.safe_load(f)
-                        if train_data:
-                            train_files_data.append((train_file, train_data))
-                except Exception:
-                    pass
+    try:
+        with os.scandir(trains_dir) as entries:
+            candidates = sorted(
+                Path(entry.path) for entry in entries
+                if entry.name.endswith(".yaml") and not entry.name.startswith("_")
+            )
+    except OSError:
+        candidates = []
+
+    for train_file, train_data in _load_yaml_files(candidates):
+        if train_data:
+            train_files_data.append((train_file, train_data))
 
     return train_files_data
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def atdd_config() -> Dict[str, Any]:
     """
     Load .atdd/config.yaml configuration.
@@ -248,7 +430,7 @@ def atdd_config() -> Dict[str, Any]:
     return load_atdd_config(REPO_ROOT)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def train_config() -> Dict[str, Any]:
     """
     Load train-specific configuration with defaults.
@@ -259,7 +441,7 @@ def train_config() -> Dict[str, Any]:
     return get_train_config(REPO_ROOT)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def wagons_registry() -> Dict[str, Any]:
     """
     Load wagons registry from plan/_wagons.yaml.
@@ -269,51 +451,64 @@ def wagons_registry() -> Dict[str, Any]:
     """
     wagons_file = PLAN_DIR / "_wagons.yaml"
     if wagons_file.exists():
-        with open(wagons_file) as f:
-            return yaml.safe_load(f)
+        return _yaml_load(wagons_file.read_bytes())
     return {"wagons": []}
 
 
 # URN resolution fixtures
-@pytest.fixture(scope="module")
-def contract_urns(wagon_manifests: List[Tuple[Path, Dict[str, Any]]]) -> List[str]:
+def _intern_urn(urn: Any) -> Any:
+    """Intern a URN string so repeats across manifests share one object."""
+    return sys.intern(urn) if isinstance(urn, str) else urn
+
+
+@pytest.fixture(scope="session")
+def produce_urn_index(wagon_manifests: List[Tuple[Path, Dict[str, Any]]]) -> Dict[str, List[str]]:
     """
-    Extract all contract URNs from wagon produce items.
+    Extract contract and telemetry URNs from wagon produce items in one pass.
 
     Returns:
-        List of unique contract URNs (e.g., "contract:ux:foundations")
+        {"contract": [...], "telemetry": [...]}, each sorted and unique
     """
-    urns = set()
+    contracts = set()
+    telemetry_urns = set()
     for _, manifest in wagon_manifests:
         for produce_item in manifest.get("produce", []):
             contract = produce_item.get("contract")
-            if contract and contract is not None:
-                urns.add(contract)
-    return sorted(urns)
+            if contract:
+                contracts.add(_intern_urn(contract))
+            telemetry = produce_item.get("telemetry")
+            if telemetry:
+                # Handle both string and list types
+                if isinstance(telemetry, list):
+                    telemetry_urns.update(map(_intern_urn, telemetry))
+                else:
+                    telemetry_urns.add(_intern_urn(telemetry))
+    return {"contract": sorted(contracts), "telemetry": sorted(telemetry_urns)}
+
+
+@pytest.fixture(scope="session")
+def contract_urns(produce_urn_index: Dict[str, List[str]]) -> List[str]:
+    """
+    Extract all contract URNs from wagon produce items.
+
+    Returns:
+        List of unique contract URNs (e.g., "contract:ux:foundations")
+    """
+    return produce_urn_index["contract"]
 
 
-@pytest.fixture(scope="module")
-def telemetry_urns(wagon_manifests: List[Tuple[Path, Dict[str, Any]]]) -> List[str]:
+@pytest.fixture(scope="session")
+def telemetry_urns(produce_urn_index: Dict[str, List[str]]) -> List[str]:
     """
     Extract all telemetry URNs from wagon produce items.
 
     Returns:
         List of unique telemetry URNs (e.g., "telemetry:ux:foundations")
     """
-    urns = set()
-    for _, manifest in wagon_manifests:
-        for produce_item in manifest.get("produce", []):
-            telemetry = produce_item.get("telemetry")
-            if telemetry and telemetry is not None:
-                # Handle both string and list types
-                if isinstance(telemetry, list):
-                    urns.update(telemetry)
-                else:
-                    urns.add(telemetry)
-    return sorted(urns)
+    return produce_urn_index["telemetry"]
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def typescript_test_files() -> List[Path]:
     """
     Discover all TypeScript test files in supabase/ and e2e/ directories.
@@ -324,19 +519,15 @@ def typescript_test_files() -> List[Path]:
     ts_tests = []
 
     # Search in supabase/functions/*/test/
-    supabase_dir = REPO_ROOT / "supabase"
-    if supabase_dir.exists():
-        ts_tests.extend(supabase_dir.rglob("*.test.ts"))
+    ts_tests.extend(_find_files(REPO_ROOT / "supabase", (".test.ts",)))
 
     # Search in e2e/
-    e2e_dir = REPO_ROOT / "e2e"
-    if e2e_dir.exists():
-        ts_tests.extend(e2e_dir.rglob("*.test.ts"))
+    ts_tests.extend(_find_files(REPO_ROOT / "e2e", (".test.ts",)))
 
     return sorted(ts_tests)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def web_typescript_test_files() -> List[Path]:
     """
     Discover all Preact TypeScript test files in web/tests/.
@@ -345,16 +536,11 @@ def web_typescript_test_files() -> List[Path]:
         List of Path objects pointing to *.test.ts and *.test.tsx files
     """
     web_tests_dir = REPO_ROOT / "web" / "tests"
-    if not web_tests_dir.exists():
-        return []
-
-    ts_tests = []
-    ts_tests.extend(web_tests_dir.rglob("*.test.ts"))
-    ts_tests.extend(web_tests_dir.rglob("*.test.tsx"))
-    return sorted(ts_tests)
+    return sorted(_find_files(web_tests_dir, (".test.ts", ".test.tsx")))
 
 
 # Helper functions
+@lru_cache(maxsize=4096)
 def parse_urn(urn: str) -> Tuple[str, str, str]:
     """
     Parse URN into components.
@@ -369,10 +555,10 @@ def parse_urn(urn: str) -> Tuple[str, str, str]:
         >>> parse_urn("contract:ux:foundations")
         ("contract", "ux", "foundations")
     """
-    parts = urn.split(":")
-    if len(parts) != 3:
+    parts = urn.split(":", 2)
+    if len(parts) != 3 or ":" in parts[2]:
         raise ValueError(f"Invalid URN format: {urn} (expected type:domain:resource)")
-    return tuple(parts)
+    return (parts[0], parts[1], parts[2])
 
 
 def get_wagon_slug(manifest: Dict[str, Any]) -> str:
@@ -411,6 +597,16 @@ def pytest_configure(config):
 
 
 if _HAS_PYTEST_HTML:
+    # nodeid substring -> report category; first match wins
+    _REPORT_CATEGORIES = (
+        ('wagons', '📋 Schema'),
+        ('cross_refs', '🔗 References'),
+        ('urn_resolution', '🗺️ URN Resolution'),
+        ('uniqueness', '🎯 Uniqueness'),
+        ('contracts_structure', '📄 Contracts'),
+        ('telemetry_structure', '📊 Telemetry'),
+    )
+
     def pytest_html_report_title(report):
         """Customize HTML report title."""
         report.title = "Platform Validation Test Report"
@@ -422,20 +618,11 @@ if _HAS_PYTEST_HTML:
 
     def pytest_html_results_table_row(report, cells):
         """Customize HTML report table rows."""
-        category = "Unknown"
-        if hasattr(report, 'nodeid'):
-            if 'wagons' in report.nodeid:
-                category = '📋 Schema'
-            elif 'cross_refs' in report.nodeid:
-                category = '🔗 References'
-            elif 'urn_resolution' in report.nodeid:
-                category = '🗺️ URN Resolution'
-            elif 'uniqueness' in report.nodeid:
-                category = '🎯 Uniqueness'
-            elif 'contracts_structure' in report.nodeid:
-                category = '📄 Contracts'
-            elif 'telemetry_structure' in report.nodeid:
-                category = '📊 Telemetry'
+        nodeid = getattr(report, "nodeid", "")
+        category = next(
+            (label for marker, label in _REPORT_CATEGORIES if marker in nodeid),
+            "Unknown",
+        )
 
         cells.insert(2, f'<td>{category}</td>')
         cells.insert(1, f'<td class="col-duration">{getattr(report, "duration", 0):.2f}s</td>')
@@ -457,7 +644,7 @@ if _HAS_PYTEST_HTML:
 # ============================================================================
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def coverage_exceptions(atdd_config: Dict[str, Any]) -> Dict[str, List[str]]:
     """
     Load coverage exception allow-lists from .atdd/config.yaml.
@@ -468,7 +655,7 @@ def coverage_exceptions(atdd_config: Dict[str, Any]) -> Dict[str, List[str]]:
     return atdd_config.get("coverage", {}).get("exceptions", {})
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def coverage_thresholds(atdd_config: Dict[str, Any]) -> Dict[str, Any]:
     """
     Load coverage threshold settings from .atdd/config.yaml.
@@ -481,7 +668,7 @@ def coverage_thresholds(atdd_config: Dict[str, Any]) -> Dict[str, Any]:
     return {**defaults, **thresholds}
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def feature_files() -> List[Tuple[Path, Dict[str, Any]]]:
     """
     Discover all feature files in plan/*/features/.
@@ -489,27 +676,14 @@ def feature_files() -> List[Tuple[Path, Dict[str, Any]]]:
     Returns:
         List of (path, feature_data) tuples
     """
-    import re
     features = []
-    if not PLAN_DIR.exists():
-        return features
-
-    for wagon_dir in PLAN_DIR.iterdir():
-        if wagon_dir.is_dir() and not wagon_dir.name.startswith("_"):
-            features_dir = wagon_dir / "features"
-            if features_dir.exists():
-                for feature_file in features_dir.glob("*.yaml"):
-                    try:
-                        with open(feature_file) as f:
-                            data = yaml.safe_load(f)
-                            if data:
-                                features.append((feature_file, data))
-                    except Exception:
-                        pass
+    for feature_file, data in _load_yaml_files(_plan_index(str(PLAN_DIR))["features"]):
+        if data:
+            features.append((feature_file, data))
     return features
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def wmbt_files() -> List[Tuple[Path, Dict[str, Any]]]:
     """
     Discover all WMBT files in plan/*/.
@@ -519,28 +693,14 @@ def wmbt_files() -> List[Tuple[Path, Dict[str, Any]]]:
     Returns:
         List of (path, wmbt_data) tuples
     """
-    import re
     wmbts = []
-    if not PLAN_DIR.exists():
-        return wmbts
-
-    wmbt_pattern = re.compile(r"^[DLPCEMYRK]\d{3}\.yaml$")
-
-    for wagon_dir in PLAN_DIR.iterdir():
-        if wagon_dir.is_dir() and not wagon_dir.name.startswith("_"):
-            for wmbt_file in wagon_dir.glob("*.yaml"):
-                if wmbt_pattern.match(wmbt_file.name):
-                    try:
-                        with open(wmbt_file) as f:
-                            data = yaml.safe_load(f)
-                            if data:
-                                wmbts.append((wmbt_file, data))
-                    except Exception:
-                        pass
+    for wmbt_file, data in _load_yaml_files(_plan_index(str(PLAN_DIR))["wmbts"]):
+        if data:
+            wmbts.append((wmbt_file, data))
     return wmbts
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def acceptance_urns_by_wagon(wmbt_files: List[Tuple[Path, Dict[str, Any]]]) -> Dict[str, List[str]]:
     """
     Extract all acceptance URNs grouped by wagon slug.
@@ -561,14 +721,14 @@ def acceptance_urns_by_wagon(wmbt_files: List[Tuple[Path, Dict[str, Any]]]) -> D
             if isinstance(acc, dict) and "identity" in acc:
                 urn = acc["identity"].get("urn", "")
                 if urn:
-                    by_wagon[wagon_slug].append(urn)
+                    by_wagon[wagon_slug].append(_intern_urn(urn))
             elif isinstance(acc, str):
-                by_wagon[wagon_slug].append(acc)
+                by_wagon[wagon_slug].append(_intern_urn(acc))
 
     return by_wagon
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def all_acceptance_urns(acceptance_urns_by_wagon: Dict[str, List[str]]) -> List[str]:
     """
     Get flat list of all acceptance URNs across all wagons.
@@ -582,7 +742,7 @@ def all_acceptance_urns(acceptance_urns_by_wagon: Dict[str, List[str]]) -> List[
     return all_urns
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def wagon_to_train_mapping(train_files: List[Tuple[Path, Dict]]) -> Dict[str, List[str]]:
     """
     Build mapping of wagon slugs to train IDs that reference them.
@@ -611,7 +771,7 @@ def wagon_to_train_mapping(train_files: List[Tuple[Path, Dict]]) -> Dict[str, Li
 # ============================================================================
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def locale_manifest_path(atdd_config: Dict[str, Any]) -> Optional[Path]:
     """
     Get path to localization manifest file from config.
@@ -625,7 +785,7 @@ def locale_manifest_path(atdd_config: Dict[str, Any]) -> Optional[Path]:
     return REPO_ROOT / manifest_rel
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def locale_manifest(locale_manifest_path: Optional[Path]) -> Optional[Dict[str, Any]]:
     """
     Load localization manifest from configured path.
@@ -638,11 +798,10 @@ def locale_manifest(locale_manifest_path: Optional[Path]) -> Optional[Dict[str,
     if not locale_manifest_path.exists():
         return None
 
-    with open(locale_manifest_path) as f:
-        return json.load(f)
+    return _json_loads(locale_manifest_path.read_bytes())
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def locales_dir(locale_manifest_path: Optional[Path]) -> Optional[Path]:
     """
     Get locales directory (parent of manifest file).
@@ -20,7 +20,7 @@ from typing import Dict, List, Set, Tuple, Any
 from atdd.coach.utils.repo import find_repo_root
 from atdd.coach.utils.coverage_phase import (
     CoveragePhase,
-    should_enforce,
+    ENFORCE_FULL,
     emit_coverage_warning
 )
 
@@ -235,7 +235,7 @@ def test_all_features_have_implementations(feature_files, coverage_exceptions):
             )
 
     if violations:
-        if should_enforce(CoveragePhase.FULL_ENFORCEMENT):
+        if ENFORCE_FULL:
             pytest.fail(
                 f"COVERAGE-CODE-4.1: Features without implementations:\n  " +
                 "\n  ".join(violations[:20]) +
@@ -292,7 +292,7 @@ def test_all_implementations_have_tests(feature_files):
                 )
 
     if violations:
-        if should_enforce(CoveragePhase.FULL_ENFORCEMENT):
+        if ENFORCE_FULL:
             pytest.fail(
                 f"COVERAGE-CODE-4.2: Implementations without tests:\n  " +
                 "\n  ".join(violations[:20]) +
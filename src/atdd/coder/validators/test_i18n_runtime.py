@@ -13,7 +13,7 @@ from typing import Optional
 
 from atdd.coach.utils.locale_phase import (
     LocalePhase,
-    should_enforce_locale,
+    ENFORCE_LOCALE_FULL,
     emit_locale_warning,
 )
 from atdd.coach.utils.repo import find_repo_root
@@ -94,7 +94,7 @@ def test_i18n_config_uses_manifest(locale_manifest, locale_manifest_path):
                 f"i18n config has hardcoded locale array: {i18n_config.relative_to(REPO_ROOT)}\n"
                 f"  Should import from manifest.json or use shared SUPPORTED_LOCALES constant"
             )
-            if should_enforce_locale(LocalePhase.FULL_ENFORCEMENT):
+            if ENFORCE_LOCALE_FULL:
                 pytest.fail(msg)
             else:
                 emit_locale_warning("LOCALE-CODE-2.1", msg, LocalePhase.FULL_ENFORCEMENT)
@@ -164,7 +164,7 @@ def test_language_switcher_uses_shared_locales(locale_manifest, locale_manifest_
                 f"LanguageSwitcher has hardcoded locale array: {switcher_file.relative_to(REPO_ROOT)}\n"
                 f"  Should import from shared SUPPORTED_LOCALES or manifest"
             )
-            if should_enforce_locale(LocalePhase.FULL_ENFORCEMENT):
+            if ENFORCE_LOCALE_FULL:
                 pytest.fail(msg)
             else:
                 emit_locale_warning("LOCALE-CODE-2.2", msg, LocalePhase.FULL_ENFORCEMENT)
@@ -34,7 +34,8 @@ import atdd
 from atdd.coach.utils.repo import find_repo_root
 from atdd.coach.utils.train_spec_phase import (
     TrainSpecPhase,
-    should_enforce,
+    ENFORCE_BACKEND,
+    ENFORCE_FULL,
     emit_phase_warning
 )
 from atdd.coach.utils.config import get_train_config
@@ -579,7 +580,7 @@ def test_backend_runner_paths():
     # Check for main runner (feature-based or flat)
     main_runner = _find_train_file("runner", "runner.py")
     if main_runner is None:
-        if should_enforce(TrainSpecPhase.BACKEND_ENFORCEMENT):
+        if ENFORCE_BACKEND:
             pytest.fail(
                 "Main TrainRunner not found.\n"
                 "Searched: python/trains/runner/runner.py, python/trains/runner.py"
@@ -607,7 +608,7 @@ def test_backend_runner_paths():
             content = f.read()
 
         if "TrainRunner" not in content:
-            if should_enforce(TrainSpecPhase.BACKEND_ENFORCEMENT):
+            if ENFORCE_BACKEND:
                 pytest.fail(
                     f"Custom runner at {runner_path} does not reference TrainRunner\n"
                     "Custom runners should extend or use the base TrainRunner"
@@ -673,7 +674,7 @@ def test_frontend_code_allowed_roots():
                 violations.append(str(rel_path))
 
     if violations and len(violations) > 10:
-        if should_enforce(TrainSpecPhase.FULL_ENFORCEMENT):
+        if ENFORCE_FULL:
             pytest.fail(
                 f"Frontend code outside allowed roots ({len(violations)} files):\n  " +
                 "\n  ".join(violations[:10]) +
@@ -744,7 +745,7 @@ def test_fastapi_template_enforcement():
                 violations.append(f"{api_file.name}: {description}")
 
     if violations:
-        if should_enforce(TrainSpecPhase.FULL_ENFORCEMENT):
+        if ENFORCE_FULL:
             pytest.fail(
                 f"FastAPI template violations:\n  " + "\n  ".join(violations) +
                 "\n\nSee: train.convention.yaml for FastAPI template requirements"
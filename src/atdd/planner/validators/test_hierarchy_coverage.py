@@ -23,7 +23,7 @@ from typing import Dict, List, Set, Tuple, Any
 from atdd.coach.utils.repo import find_repo_root
 from atdd.coach.utils.coverage_phase import (
     CoveragePhase,
-    should_enforce,
+    ENFORCE_PLANNER_TESTER,
     emit_coverage_warning
 )
 
@@ -74,7 +74,7 @@ def test_all_wagons_in_at_least_one_train(
             )
 
     if violations:
-        if should_enforce(CoveragePhase.PLANNER_TESTER_ENFORCEMENT):
+        if ENFORCE_PLANNER_TESTER:
             pytest.fail(
                 f"COVERAGE-PLAN-2.1a: Wagons not in any train:\n  " +
                 "\n  ".join(violations) +
@@ -116,7 +116,7 @@ def test_all_train_wagon_refs_exist(train_files, wagon_manifests):
                     )
 
     if violations:
-        if should_enforce(CoveragePhase.PLANNER_TESTER_ENFORCEMENT):
+        if ENFORCE_PLANNER_TESTER:
             pytest.fail(
                 f"COVERAGE-PLAN-2.1b: Train wagon references to non-existent wagons:\n  " +
                 "\n  ".join(violations)
@@ -194,7 +194,7 @@ def test_all_features_in_wagon_manifest(feature_files, wagon_manifests, coverage
             )
 
     if violations:
-        if should_enforce(CoveragePhase.PLANNER_TESTER_ENFORCEMENT):
+        if ENFORCE_PLANNER_TESTER:
             pytest.fail(
                 f"COVERAGE-PLAN-2.2a: Features not in wagon manifest:\n  " +
                 "\n  ".join(violations) +
@@ -257,7 +257,7 @@ def test_all_wagon_feature_refs_exist(wagon_manifests):
                 )
 
     if violations:
-        if should_enforce(CoveragePhase.PLANNER_TESTER_ENFORCEMENT):
+        if ENFORCE_PLANNER_TESTER:
             pytest.fail(
                 f"COVERAGE-PLAN-2.2b: Wagon feature references without files:\n  " +
                 "\n  ".join(violations)
@@ -323,7 +323,7 @@ def test_all_wmbts_in_at_least_one_feature(wmbt_files, feature_files):
             )
 
     if violations:
-        if should_enforce(CoveragePhase.PLANNER_TESTER_ENFORCEMENT):
+        if ENFORCE_PLANNER_TESTER:
             pytest.fail(
                 f"COVERAGE-PLAN-2.3: WMBTs not in any feature:\n  " +
                 "\n  ".join(violations) +
@@ -375,7 +375,7 @@ def test_all_wmbts_have_acceptances(wmbt_files, coverage_exceptions):
             )
 
     if violations:
-        if should_enforce(CoveragePhase.PLANNER_TESTER_ENFORCEMENT):
+        if ENFORCE_PLANNER_TESTER:
             pytest.fail(
                 f"COVERAGE-PLAN-2.4: WMBTs without acceptances:\n  " +
                 "\n  ".join(violations) +
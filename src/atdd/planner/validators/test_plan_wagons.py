@@ -24,7 +24,7 @@ except ImportError:
 
 @pytest.mark.platform
 @pytest.mark.e2e
-def test_wagon_manifest_matches_schema(wagon_schema, wagon_manifests):
+def test_wagon_manifest_matches_schema(wagon_validator, wagon_manifests):
     """
     SPEC-PLATFORM-WAGONS-0001: Wagon manifest validates against wagon.schema.json
 
@@ -37,9 +37,10 @@ def test_wagon_manifest_matches_schema(wagon_schema, wagon_manifests):
     errors = []
 
     for manifest_path, manifest in wagon_manifests:
-        try:
-            jsonschema.validate(manifest, wagon_schema)
-        except jsonschema.ValidationError as e:
+        # Same error jsonschema.validate() would raise, without rebuilding
+        # the validator for every manifest
+        e = jsonschema.exceptions.best_match(wagon_validator.iter_errors(manifest))
+        if e is not None:
             errors.append(
                 f"Wagon manifest validation failed for {manifest_path}:\n"
                 f"  Error: {e.message}\n"
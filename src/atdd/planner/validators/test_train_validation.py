@@ -31,7 +31,7 @@ from typing import Dict, List, Set, Tuple, Any, Optional
 from atdd.coach.utils.repo import find_repo_root
 from atdd.coach.utils.train_spec_phase import (
     TrainSpecPhase,
-    should_enforce,
+    ENFORCE_FULL,
     emit_phase_warning
 )
 
@@ -657,7 +657,7 @@ def test_train_path_file_normalization(trains_registry):
                 )
 
     if deprecation_warnings:
-        if should_enforce(TrainSpecPhase.FULL_ENFORCEMENT):
+        if ENFORCE_FULL:
             pytest.fail(
                 f"Trains using deprecated 'file' field:\n  " +
                 "\n  ".join(deprecation_warnings) +
@@ -775,7 +775,7 @@ def test_train_explicit_theme_matches_group(trains_registry_with_groups):
                     )
 
     if mismatches:
-        if should_enforce(TrainSpecPhase.FULL_ENFORCEMENT):
+        if ENFORCE_FULL:
             pytest.fail(
                 f"Theme mismatches found:\n  " + "\n  ".join(mismatches)
             )
@@ -834,7 +834,7 @@ def test_train_yaml_themes_include_derived(train_files):
                 )
 
     if mismatches:
-        if should_enforce(TrainSpecPhase.FULL_ENFORCEMENT):
+        if ENFORCE_FULL:
             pytest.fail(
                 f"YAML themes missing derived themes:\n  " + "\n  ".join(mismatches)
             )
@@ -873,7 +873,7 @@ def test_train_participants_canonical_wagon_source(train_files):
             missing_participants.append(f"{train_id}: no wagon participants found")
 
     if missing_participants:
-        if should_enforce(TrainSpecPhase.FULL_ENFORCEMENT):
+        if ENFORCE_FULL:
             pytest.fail(
                 f"Trains missing wagon participants:\n  " + "\n  ".join(missing_participants)
             )
@@ -928,7 +928,7 @@ def test_train_registry_wagons_subset_of_yaml(trains_registry, train_files):
                 )
 
     if violations:
-        if should_enforce(TrainSpecPhase.FULL_ENFORCEMENT):
+        if ENFORCE_FULL:
             pytest.fail(
                 f"Registry wagons not in YAML participants:\n  " + "\n  ".join(violations)
             )
@@ -970,7 +970,7 @@ def test_train_primary_wagon_in_participants(train_files):
             )
 
     if violations:
-        if should_enforce(TrainSpecPhase.FULL_ENFORCEMENT):
+        if ENFORCE_FULL:
             pytest.fail(
                 f"Primary wagon violations:\n  " + "\n  ".join(violations)
             )
@@ -1174,7 +1174,7 @@ def test_train_status_expectations_conflict(train_files):
             )
 
     if conflicts:
-        if should_enforce(TrainSpecPhase.FULL_ENFORCEMENT):
+        if ENFORCE_FULL:
             pytest.fail(
                 f"Status/expectations conflicts:\n  " + "\n  ".join(conflicts)
             )
@@ -25,7 +25,7 @@ from typing import Dict, List, Set, Tuple, Any, Optional
 from atdd.coach.utils.repo import find_repo_root
 from atdd.coach.utils.coverage_phase import (
     CoveragePhase,
-    should_enforce,
+    ENFORCE_PLANNER_TESTER,
     emit_coverage_warning
 )
 
@@ -171,7 +171,7 @@ def test_all_acceptances_have_tests(all_acceptance_urns, coverage_exceptions):
             violations.append(acceptance_urn)
 
     if violations:
-        if should_enforce(CoveragePhase.PLANNER_TESTER_ENFORCEMENT):
+        if ENFORCE_PLANNER_TESTER:
             pytest.fail(
                 f"COVERAGE-TEST-3.1: Acceptances without tests ({len(violations)}):\n  " +
                 "\n  ".join(violations[:20]) +
@@ -263,7 +263,7 @@ def test_all_contracts_referenced(wagon_manifests, coverage_exceptions):
                 )
 
     if violations:
-        if should_enforce(CoveragePhase.PLANNER_TESTER_ENFORCEMENT):
+        if ENFORCE_PLANNER_TESTER:
             pytest.fail(
                 f"COVERAGE-TEST-3.2a: Contracts not referenced:\n  " +
                 "\n  ".join(violations[:20]) +
@@ -326,7 +326,7 @@ def test_all_contract_refs_exist(wagon_manifests):
                         )
 
     if violations:
-        if should_enforce(CoveragePhase.PLANNER_TESTER_ENFORCEMENT):
+        if ENFORCE_PLANNER_TESTER:
             pytest.fail(
                 f"COVERAGE-TEST-3.2b: Contract references without files:\n  " +
                 "\n  ".join(violations)
@@ -411,7 +411,7 @@ def test_all_telemetry_referenced(wagon_manifests, coverage_exceptions):
                 )
 
     if violations:
-        if should_enforce(CoveragePhase.PLANNER_TESTER_ENFORCEMENT):
+        if ENFORCE_PLANNER_TESTER:
             pytest.fail(
                 f"COVERAGE-TEST-3.3a: Telemetry not referenced:\n  " +
                 "\n  ".join(violations[:20]) +
@@ -479,7 +479,7 @@ def test_all_telemetry_refs_exist(wagon_manifests):
                             )
 
     if violations:
-        if should_enforce(CoveragePhase.PLANNER_TESTER_ENFORCEMENT):
+        if ENFORCE_PLANNER_TESTER:
             pytest.fail(
                 f"COVERAGE-TEST-3.3b: Telemetry references without files:\n  " +
                 "\n  ".join(violations)
@@ -535,7 +535,7 @@ def test_telemetry_manifest_complete():
                 violations.append(f"{signal_urn or signal_path}: file not found")
 
     if violations:
-        if should_enforce(CoveragePhase.PLANNER_TESTER_ENFORCEMENT):
+        if ENFORCE_PLANNER_TESTER:
             pytest.fail(
                 f"COVERAGE-TEST-3.4: Tracking manifest signals missing:\n  " +
                 "\n  ".join(violations)
@@ -18,8 +18,7 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 
 import atdd
 from atdd.coach.utils.locale_phase import (
-    LocalePhase,
-    should_enforce_locale,
+    ENFORCE_LOCALE_TESTER,
     emit_locale_warning,
 )
 from atdd.coach.utils.repo import find_repo_root
@@ -115,7 +114,7 @@ def test_locale_manifest_schema_compliance(locale_manifest, locale_manifest_path
 
     if not locale_manifest_path.exists():
         msg = f"Manifest file not found: {locale_manifest_path.relative_to(REPO_ROOT)}"
-        if should_enforce_locale(LocalePhase.TESTER_ENFORCEMENT):
+        if ENFORCE_LOCALE_TESTER:
             pytest.fail(msg)
         else:
             emit_locale_warning("LOCALE-TEST-1.1", msg)
@@ -128,7 +127,7 @@ def test_locale_manifest_schema_compliance(locale_manifest, locale_manifest_path
         jsonschema.validate(locale_manifest, schema)
     except jsonschema.ValidationError as e:
         msg = f"Manifest schema validation failed: {e.message}"
-        if should_enforce_locale(LocalePhase.TESTER_ENFORCEMENT):
+        if ENFORCE_LOCALE_TESTER:
             pytest.fail(msg)
         else:
             emit_locale_warning("LOCALE-TEST-1.1", msg)
@@ -136,7 +135,7 @@ def test_locale_manifest_schema_compliance(locale_manifest, locale_manifest_path
 
     if locale_manifest["reference"] not in locale_manifest["locales"]:
         msg = f"Reference locale '{locale_manifest['reference']}' not in locales list"
-        if should_enforce_locale(LocalePhase.TESTER_ENFORCEMENT):
+        if ENFORCE_LOCALE_TESTER:
             pytest.fail(msg)
         else:
             emit_locale_warning("LOCALE-TEST-1.1", msg)
@@ -170,7 +169,7 @@ def test_locale_files_exist(locale_manifest, locales_dir):
         if len(missing_files) > 20:
             msg += f"\n  ... and {len(missing_files) - 20} more"
 
-        if should_enforce_locale(LocalePhase.TESTER_ENFORCEMENT):
+        if ENFORCE_LOCALE_TESTER:
             pytest.fail(msg)
         else:
             emit_locale_warning("LOCALE-TEST-1.2", msg)
@@ -210,7 +209,7 @@ def test_locale_files_valid_json(locale_manifest, locales_dir):
         if len(invalid_files) > 10:
             msg += f"\n  ... and {len(invalid_files) - 10} more"
 
-        if should_enforce_locale(LocalePhase.TESTER_ENFORCEMENT):
+        if ENFORCE_LOCALE_TESTER:
             pytest.fail(msg)
         else:
             emit_locale_warning("LOCALE-TEST-1.3", msg)
@@ -276,7 +275,7 @@ def test_locale_keys_match_reference(locale_manifest, locales_dir):
         if len(key_mismatches) > 15:
             msg += f"\n  ... and {len(key_mismatches) - 15} more"
 
-        if should_enforce_locale(LocalePhase.TESTER_ENFORCEMENT):
+        if ENFORCE_LOCALE_TESTER:
             pytest.fail(msg)
         else:
             emit_locale_warning("LOCALE-TEST-1.4", msg)
@@ -327,7 +326,7 @@ def test_locale_types_match_reference(locale_manifest, locales_dir):
         if len(type_mismatches) > 10:
             msg += f"\n  ... and {len(type_mismatches) - 10} more"
 
-        if should_enforce_locale(LocalePhase.TESTER_ENFORCEMENT):
+        if ENFORCE_LOCALE_TESTER:
             pytest.fail(msg)
         else:
             emit_locale_warning("LOCALE-TEST-1.5", msg)
@@ -396,7 +395,7 @@ def test_optional_namespaces_match_reference(locale_manifest, locales_dir):
         if len(key_mismatches) > 10:
             msg += f"\n  ... and {len(key_mismatches) - 10} more"
 
-        if should_enforce_locale(LocalePhase.TESTER_ENFORCEMENT):
+        if ENFORCE_LOCALE_TESTER:
             pytest.fail(msg)
         else:
             emit_locale_warning("LOCALE-TEST-1.6", msg)
@@ -431,7 +430,7 @@ def test_language_names_complete(locale_manifest, locales_dir):
     language_names = ui_data.get("languageNames", {})
     if not language_names:
         msg = "Reference ui.json missing 'languageNames' object"
-        if should_enforce_locale(LocalePhase.TESTER_ENFORCEMENT):
+        if ENFORCE_LOCALE_TESTER:
             pytest.fail(msg)
         else:
             emit_locale_warning("LOCALE-TEST-1.7", msg)
@@ -444,7 +443,7 @@ def test_language_names_complete(locale_manifest, locales_dir):
 
     if missing_names:
         msg = f"Missing languageNames entries for locales: {', '.join(missing_names)}"
-        if should_enforce_locale(LocalePhase.TESTER_ENFORCEMENT):
+        if ENFORCE_LOCALE_TESTER:
             pytest.fail(msg)
         else:
             emit_locale_warning("LOCALE-TEST-1.7", msg)
@@ -26,7 +26,7 @@ import atdd
 from atdd.coach.utils.repo import find_repo_root
 from atdd.coach.utils.train_spec_phase import (
     TrainSpecPhase,
-    should_enforce,
+    ENFORCE_BACKEND,
     emit_phase_warning
 )
 
@@ -219,7 +219,7 @@ def test_backend_e2e_path_convention():
                 )
 
     if violations:
-        if should_enforce(TrainSpecPhase.BACKEND_ENFORCEMENT):
+        if ENFORCE_BACKEND:
             pytest.fail(
                 f"Backend E2E path violations:\n  " + "\n  ".join(violations) +
                 "\n\nExpected: e2e/<theme>/test_<train_id>[_<slug>].py"
@@ -265,7 +265,7 @@ def test_backend_e2e_pytest_markers():
     violations = missing_markers + mismatched_markers
 
     if violations:
-        if should_enforce(TrainSpecPhase.BACKEND_ENFORCEMENT):
+        if ENFORCE_BACKEND:
             pytest.fail(
                 f"Backend E2E marker issues:\n  " + "\n  ".join(violations) +
                 "\n\nExpected: @pytest.mark.train(\"<train_id>\")"
@@ -315,7 +315,7 @@ def test_backend_e2e_see_annotation():
     violations = missing_see + invalid_see
 
     if violations:
-        if should_enforce(TrainSpecPhase.BACKEND_ENFORCEMENT):
+        if ENFORCE_BACKEND:
             pytest.fail(
                 f"Backend E2E @see annotation issues:\n  " + "\n  ".join(violations) +
                 "\n\nExpected: @see plan/_trains/<train_id>.yaml"
@@ -357,7 +357,7 @@ def test_backend_e2e_runner_evidence():
             )
 
     if no_evidence:
-        if should_enforce(TrainSpecPhase.BACKEND_ENFORCEMENT):
+        if ENFORCE_BACKEND:
             pytest.fail(
                 f"Backend E2E tests missing runner evidence:\n  " + "\n  ".join(no_evidence) +
                 "\n\nExpected: train_runner fixture, TrainRunner import, or .execute() call"
@@ -23,7 +23,7 @@ import atdd
 from atdd.coach.utils.repo import find_repo_root
 from atdd.coach.utils.train_spec_phase import (
     TrainSpecPhase,
-    should_enforce,
+    ENFORCE_FULL,
     emit_phase_warning
 )
 
@@ -180,7 +180,7 @@ def test_frontend_e2e_path_convention():
         )
 
     if violations:
-        if should_enforce(TrainSpecPhase.FULL_ENFORCEMENT):
+        if ENFORCE_FULL:
             pytest.fail(
                 f"Frontend E2E path violations:\n  " + "\n  ".join(violations) +
                 "\n\nExpected: web/e2e/<train_id>/*.spec.ts"
@@ -228,7 +228,7 @@ def test_frontend_e2e_train_annotation():
     violations = missing_annotation + mismatched_annotation
 
     if violations:
-        if should_enforce(TrainSpecPhase.FULL_ENFORCEMENT):
+        if ENFORCE_FULL:
             pytest.fail(
                 f"Frontend E2E @train annotation issues:\n  " + "\n  ".join(violations) +
                 "\n\nExpected: @train <train_id> in JSDoc comment"
@@ -278,7 +278,7 @@ def test_frontend_e2e_see_annotation():
     violations = missing_see + invalid_see
 
     if violations:
-        if should_enforce(TrainSpecPhase.FULL_ENFORCEMENT):
+        if ENFORCE_FULL:
             pytest.fail(
                 f"Frontend E2E @see annotation issues:\n  " + "\n  ".join(violations) +
                 "\n\nExpected: @see plan/_trains/<train_id>.yaml"
@@ -21,7 +21,7 @@ import atdd
 from atdd.coach.utils.repo import find_repo_root
 from atdd.coach.utils.train_spec_phase import (
     TrainSpecPhase,
-    should_enforce,
+    ENFORCE_FULL,
     emit_phase_warning
 )
 
@@ -180,7 +180,7 @@ def test_frontend_python_code_paths():
     code_files = _find_frontend_python_code_files()
 
     if not code_files:
-        if should_enforce(TrainSpecPhase.FULL_ENFORCEMENT):
+        if ENFORCE_FULL:
             pytest.fail(
                 f"Trains expect frontend_python but no code found in python/streamlit/ or python/apps/:\n"
                 f"  Trains: {trains_with_frontend_python}"
@@ -201,7 +201,7 @@ def test_frontend_python_code_paths():
             missing_code.append(f"{train_id}: no code references found")
 
     if missing_code:
-        if should_enforce(TrainSpecPhase.FULL_ENFORCEMENT):
+        if ENFORCE_FULL:
             pytest.fail(
                 f"Trains missing frontend_python code:\n  " + "\n  ".join(missing_code) +
                 "\n\nExpected code in: python/streamlit/ or python/apps/"
@@ -244,7 +244,7 @@ def test_frontend_python_test_paths():
             )
 
     if missing_tests:
-        if should_enforce(TrainSpecPhase.FULL_ENFORCEMENT):
+        if ENFORCE_FULL:
             pytest.fail(
                 f"Trains missing frontend_python tests:\n  " + "\n  ".join(missing_tests) +
                 "\n\nExpected: python/tests/streamlit/test_<train_id>[_<slug>].py"
@@ -269,7 +269,7 @@ def test_frontend_python_test_paths():
             )
 
     if invalid_tests:
-        if should_enforce(TrainSpecPhase.FULL_ENFORCEMENT):
+        if ENFORCE_FULL:
             pytest.fail(
                 f"Frontend Python test path issues:\n  " + "\n  ".join(invalid_tests)
             )